@@ -1,6 +1,6 @@
 import gradio as gr
-import joblib
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 import os
 
 from src.predict.models import (
@@ -13,23 +13,73 @@ from src.predict.models import (
     BernoulliNBModel,
     LGBMModel
 )
+from src.predict.model_loader import get_model, preload_models
 from src.config import MODELS_DIR
 
 # --- Model Cache ---
-# This global dictionary will store loaded models to avoid reloading them from disk.
-MODEL_CACHE = {}
+# Set UFC_LAZY_LOAD=1 to load models on first use instead of at startup (saves RAM).
+LAZY_LOAD = os.environ.get("UFC_LAZY_LOAD", "0") == "1"
 
 # --- Gradio App Setup ---
 if not os.path.exists(MODELS_DIR):
     os.makedirs(MODELS_DIR)
     print(f"Warning: Models directory not found. Created a dummy directory at '{MODELS_DIR}'.")
 
+# Scanned once per process so startup and preloading share one listing. A hot
+# reload re-runs this module and rescans. Models saved while the app is running
+# do not appear in the dropdown until it is restarted.
+_AVAILABLE_MODELS = None
+
+def _list_models():
+    """Returns the sorted names of the saved models in MODELS_DIR."""
+    global _AVAILABLE_MODELS
+    if _AVAILABLE_MODELS is None:
+        with os.scandir(MODELS_DIR) as entries:
+            _AVAILABLE_MODELS = tuple(sorted(
+                e.name for e in entries if e.is_file() and e.name.endswith(".joblib")
+            ))
+    return _AVAILABLE_MODELS
+
 # Get a list of available models
-available_models = [f for f in os.listdir(MODELS_DIR) if f.endswith(".joblib")]
+available_models = list(_list_models())
 if not available_models:
     print(f"Warning: No models found in '{MODELS_DIR}'. The dropdown will be empty.")
     available_models.append("No models found")
 
+if not LAZY_LOAD:
+    preload_models(_list_models())
+
+# --- Date Cache ---
+# Today's date formatted as an event date, refreshed only when the day changes.
+_TODAY_CACHE = {'day': None, 'str': None}
+
+def get_today_str():
+    """Returns today's date in the event date format, cached per day."""
+    today = date.today()
+    if _TODAY_CACHE['day'] != today:
+        _TODAY_CACHE['day'] = today
+        _TODAY_CACHE['str'] = today.strftime('%B %d, %Y')
+    return _TODAY_CACHE['str']
+
+# --- Prediction Cache ---
+@lru_cache(maxsize=1024)
+def _predict_cached(model_name, fighter1_name, fighter2_name, date_str):
+    """
+    Runs the model prediction for a matchup. Results are cached per model, fighters and
+    date, so repeated clicks on the same matchup skip the model entirely.
+    """
+    fight = {
+        'fighter_1': fighter1_name,
+        'fighter_2': fighter2_name,
+        'event_date': date_str
+    }
+    return get_model(model_name).predict(fight)
+
+def clear_prediction_cache():
+    """Empties the prediction cache."""
+    _predict_cached.cache_clear()
+    print("Prediction cache cleared.")
+
 # --- Prediction Function ---
 def predict_fight(model_name, fighter1_name, fighter2_name):
     """
@@ -39,22 +89,8 @@ def predict_fight(model_name, fighter1_name, fighter2_name):
         return "Please select a model and enter both fighter names.", ""
 
     try:
-        # Load model from cache or from disk if it's the first time
-        if model_name not in MODEL_CACHE:
-            print(f"Loading and caching model: {model_name}...")
-            model_path = os.path.join(MODELS_DIR, model_name)
-            MODEL_CACHE[model_name] = joblib.load(model_path)
-            print("...model cached.")
-
-        model = MODEL_CACHE[model_name]
-
-        fight = {
-            'fighter_1': fighter1_name,
-            'fighter_2': fighter2_name,
-            'event_date': datetime.now().strftime('%B %d, %Y')
-        }
-
-        prediction_result = model.predict(fight)
+        # Models are preloaded at startup; evicted models and lazy mode load on first use
+        prediction_result = _predict_cached(model_name, fighter1_name, fighter2_name, get_today_str())
 
         if prediction_result and prediction_result.get('winner'):
             winner = prediction_result['winner']
@@ -85,6 +121,7 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:
             fighter2_input = gr.Textbox(label="Fighter 2", placeholder="e.g., Stipe Miocic")
 
     predict_button = gr.Button("Predict Winner")
+    clear_cache_button = gr.Button("Clear Prediction Cache", size="sm")
 
     with gr.Column():
         winner_output = gr.Textbox(label="Predicted Winner", interactive=False)
@@ -95,6 +132,7 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:
         inputs=[model_dropdown, fighter1_input, fighter2_input],
         outputs=[winner_output, prob_output]
     )
+    clear_cache_button.click(fn=clear_prediction_cache, inputs=None, outputs=None)
 
 # --- Launch the App ---
 demo.launch() 
\ No newline at end of file
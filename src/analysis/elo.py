@@ -1,17 +1,26 @@
-import csv
+import math
 import os
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from ..config import FIGHTS_CSV_PATH, FIGHTERS_CSV_PATH
+from ..io_cache import load_fights
 
 # --- ELO Configuration ---
 INITIAL_ELO = 1500
 K_FACTOR = 40
 # --- End Configuration ---
 
+ELO_COLUMNS = ['fighter_1', 'fighter_2', 'winner', 'event_date']
+
+# 10 ** (x / 400) == exp(x * ln(10) / 400); math.exp is cheaper than a float pow.
+ELO_EXP_SCALE = math.log(10) / 400
+
 def calculate_expected_score(rating1, rating2):
     """Calculates the expected score for player 1 against player 2."""
-    return 1 / (1 + 10 ** ((rating2 - rating1) / 400))
+    return 1.0 / (1.0 + math.exp((rating2 - rating1) * ELO_EXP_SCALE))
 
 def update_elo(winner_elo, loser_elo):
     """Calculates the new ELO ratings for a win/loss scenario."""
@@ -29,57 +38,82 @@ def update_elo_draw(elo1, elo2):
 
     return elo1 + change1, elo2 + change2
 
+def _run_elo(f1_ids, f2_ids, outcomes, n_fighters):
+    """
+    Runs the sequential ELO updates over integer-encoded fights.
+    Outcomes are encoded as 0 (fighter 1 won), 1 (fighter 2 won), 2 (draw), 3 (no contest).
+    """
+    ratings = [INITIAL_ELO] * n_fighters
+    for i1, i2, outcome in zip(f1_ids.tolist(), f2_ids.tolist(), outcomes.tolist()):
+        if outcome == 0:
+            ratings[i1], ratings[i2] = update_elo(ratings[i1], ratings[i2])
+        elif outcome == 1:
+            ratings[i2], ratings[i1] = update_elo(ratings[i2], ratings[i1])
+        elif outcome == 2:
+            ratings[i1], ratings[i2] = update_elo_draw(ratings[i1], ratings[i2])
+        # NC (No Contest) fights do not affect ELO
+    return np.array(ratings, dtype=np.float64)
+
 def process_fights_for_elo(fights_data=FIGHTS_CSV_PATH):
     """
     Processes fights chronologically to calculate ELO scores.
     Accepts either a CSV file path or a pre-loaded list of fights.
     """
-    fights = []
     if isinstance(fights_data, str):
         # If a string is passed, treat it as a file path
         if not os.path.exists(fights_data):
             print(f"Error: Fights data file not found at '{fights_data}'.")
             return None
-        with open(fights_data, 'r', encoding='utf-8') as f:
-            fights = list(csv.DictReader(f))
+        # Read only the needed columns as plain strings; empty cells stay '' like in the CSV
+        try:
+            fights = load_fights(fights_data, usecols=ELO_COLUMNS, dtype=str, keep_default_na=False)
+        except pd.errors.EmptyDataError:
+            # An empty file has no fights to rate
+            return {}
+        except ValueError as e:
+            print(f"Error: Fights data file '{fights_data}' is missing required columns: {e}")
+            return None
     elif isinstance(fights_data, list):
         # If a list is passed, use it directly
-        fights = fights_data
+        fights = pd.DataFrame(fights_data)
     else:
         print(f"Error: Invalid data type passed to process_fights_for_elo: {type(fights_data)}")
         return None
 
+    if fights.empty:
+        return {}
+
+    missing_columns = [col for col in ELO_COLUMNS if col not in fights.columns]
+    if missing_columns:
+        print(f"Error: Fights data is missing required columns: {missing_columns}")
+        return None
+    fights = fights[ELO_COLUMNS]
+
     # Sort fights by date to process them in chronological order.
     # This is crucial if loading from a file and a good safeguard if a list is passed.
+    # Each unique date is parsed only once; many fights share the same event date.
     try:
-        fights.sort(key=lambda x: datetime.strptime(x['event_date'], '%B %d, %Y'))
-    except (ValueError, KeyError) as e:
+        date_ord = {d: datetime.strptime(d, '%B %d, %Y').toordinal() for d in fights['event_date'].unique()}
+        fights = fights.assign(date_ord=fights['event_date'].map(date_ord))
+        fights = fights.sort_values('date_ord', kind='mergesort')
+    except (ValueError, KeyError, TypeError) as e:
         print(f"Error sorting fights by date: {e}")
         return None
-        
-    elos = {}
-    
-    for fight in fights:
-        fighter1 = fight.get('fighter_1')
-        fighter2 = fight.get('fighter_2')
-        winner = fight.get('winner')
-
-        # Initialize ELO for new fighters
-        if fighter1 not in elos: elos[fighter1] = INITIAL_ELO
-        if fighter2 not in elos: elos[fighter2] = INITIAL_ELO
-
-        elo1 = elos[fighter1]
-        elo2 = elos[fighter2]
-
-        if winner == fighter1:
-            elos[fighter1], elos[fighter2] = update_elo(elo1, elo2)
-        elif winner == fighter2:
-            elos[fighter2], elos[fighter1] = update_elo(elo2, elo1)
-        elif winner == "Draw":
-            elos[fighter1], elos[fighter2] = update_elo_draw(elo1, elo2)
-        # NC (No Contest) fights do not affect ELO
 
-    return elos
+    # Encode fighters as integer ids, keeping the order in which they first appear
+    fighter_pairs = fights[['fighter_1', 'fighter_2']].to_numpy().ravel()
+    fighter_ids, names = pd.factorize(fighter_pairs, use_na_sentinel=False)
+    fighter_ids = fighter_ids.reshape(-1, 2)
+
+    winner = fights['winner'].to_numpy()
+    outcomes = np.select(
+        [winner == fights['fighter_1'].to_numpy(), winner == fights['fighter_2'].to_numpy(), winner == "Draw"],
+        [0, 1, 2],
+        default=3
+    ).astype(np.int8)
+
+    ratings = _run_elo(fighter_ids[:, 0], fighter_ids[:, 1], outcomes, len(names))
+    return dict(zip(names, ratings.tolist()))
 
 def add_elo_to_fighters_csv(elos, fighters_csv_path=FIGHTERS_CSV_PATH):
     """
@@ -93,23 +127,11 @@ def add_elo_to_fighters_csv(elos, fighters_csv_path=FIGHTERS_CSV_PATH):
         print(f"Error: Fighters data file not found at '{fighters_csv_path}'. Cannot add ELO column.")
         return
 
-    rows = []
-    with open(fighters_csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames
-        # Ensure 'elo' column is added if not present
-        if 'elo' not in headers:
-            headers.append('elo')
-        rows = list(reader)
-
-    for row in rows:
-        full_name = f"{row.get('first_name', '')} {row.get('last_name', '')}".strip()
-        row['elo'] = round(elos.get(full_name, INITIAL_ELO))
-
-    with open(fighters_csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(rows)
+    # Read every column as text so the other columns are written back unchanged
+    fighters = pd.read_csv(fighters_csv_path, dtype=str, keep_default_na=False)
+    full_names = fighters['first_name'].str.cat(fighters['last_name'], sep=' ').str.strip()
+    fighters['elo'] = full_names.map(elos).fillna(INITIAL_ELO).round().astype(int)
+    fighters.to_csv(fighters_csv_path, index=False)
 
     print(f"Successfully updated '{fighters_csv_path}' with ELO ratings.")
 
@@ -7,4 +7,7 @@ FIGHTS_CSV_PATH = os.path.join(OUTPUT_DIR, 'ufc_fights.csv')
 FIGHTERS_CSV_PATH = os.path.join(OUTPUT_DIR, 'ufc_fighters.csv')
 EVENTS_JSON_PATH = os.path.join(OUTPUT_DIR, 'events.json')
 FIGHTERS_JSON_PATH = os.path.join(OUTPUT_DIR, 'fighters.json')
-LAST_EVENT_JSON_PATH = os.path.join(OUTPUT_DIR, 'last_event.json')
\ No newline at end of file
+LAST_EVENT_JSON_PATH = os.path.join(OUTPUT_DIR, 'last_event.json')
+CACHE_DIR = os.path.join(OUTPUT_DIR, '_cache')
+# Models trained on the pipeline's train split, kept for reuse apart from the served MODELS_DIR
+TRAINED_MODELS_CACHE_DIR = os.path.join(CACHE_DIR, 'models')
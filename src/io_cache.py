@@ -0,0 +1,28 @@
+import os
+import joblib
+import pandas as pd
+
+from .config import CACHE_DIR, FIGHTS_CSV_PATH, FIGHTERS_CSV_PATH
+
+# Parsed CSV files are cached on disk so repeated runs skip the CSV parsing.
+memory = joblib.Memory(CACHE_DIR, verbose=0)
+
+@memory.cache
+def _read_csv(path, mtime, **read_csv_kwargs):
+    """
+    Parses a CSV file into a DataFrame. The file's modification time is part of
+    the cache key, so the cache is invalidated whenever the file changes.
+    """
+    return pd.read_csv(path, **read_csv_kwargs)
+
+def read_csv_cached(path, **read_csv_kwargs):
+    """Reads a CSV file through the disk cache. Accepts the same keyword arguments as pd.read_csv."""
+    return _read_csv(path, os.path.getmtime(path), **read_csv_kwargs)
+
+def load_fights(path=FIGHTS_CSV_PATH, **read_csv_kwargs):
+    """Loads the fights CSV through the disk cache."""
+    return read_csv_cached(path, **read_csv_kwargs)
+
+def load_fighters(path=FIGHTERS_CSV_PATH, **read_csv_kwargs):
+    """Loads the fighters CSV through the disk cache."""
+    return read_csv_cached(path, **read_csv_kwargs)
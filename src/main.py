@@ -47,6 +47,25 @@ def main():
         default=False,
         help="Force retrain all models even if no new data is available."
     )
+    parser.add_argument(
+        '--deep-verify',
+        action='store_true',
+        default=False,
+        help="Fully load saved models to check them, instead of only checking their file headers."
+    )
+    parser.add_argument(
+        '--n-jobs',
+        type=int,
+        default=None,
+        help="Processes used to train models in parallel (-1 uses every core). By default models "
+             "are trained in one process, and k-fold CV runs its folds on every core."
+    )
+    parser.add_argument(
+        '--models',
+        type=str,
+        default=None,
+        help="Comma-separated models to run for 'predict' and 'update' (e.g. 'elo,lr,lgbm')."
+    )
     
     args = parser.parse_args()
     
@@ -70,15 +89,20 @@ def main():
     if args.pipeline == 'update':
         print("\n=== Running Model Update Pipeline ===")
         try:
-            from src.predict.main import MODELS_TO_RUN
+            from src.predict.main import build_models, parse_model_names
             from src.predict.pipeline import PredictionPipeline
         except ImportError:
             print("Fatal: Could not import prediction modules.")
             print("Please ensure your project structure and python path are correct.")
             return
 
-        pipeline = PredictionPipeline(models=MODELS_TO_RUN)
-        pipeline.update_models_if_new_data()
+        try:
+            models = build_models(parse_model_names(args.models) if args.models else None)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        pipeline = PredictionPipeline(models=models, deep_verify=args.deep_verify)
+        pipeline.update_models_if_new_data(**({} if args.n_jobs is None else {'n_jobs': args.n_jobs}))
     
     if args.pipeline in ['predict', 'all']:
         print("\n=== Running Prediction Pipeline ===")
@@ -95,6 +119,15 @@ def main():
             
         if args.force_retrain:
             predict_args.append('--force-retrain')
+
+        if args.deep_verify:
+            predict_args.append('--deep-verify')
+
+        if args.models:
+            predict_args.extend(['--models', args.models])
+
+        if args.n_jobs is not None:
+            predict_args.extend(['--n-jobs', str(args.n_jobs)])
             
         sys.argv = predict_args
         try:
@@ -1,10 +1,38 @@
 """Configuration module for UFC prediction models."""
+import os
 
 # Model settings
 DEFAULT_ELO = 1500
 N_FIGHTS_HISTORY = 5
 DEFAULT_ROUNDS_DURATION = 5 * 60  # 5 minutes per round
 
+# Threads used by each estimator. Kept at 1 so the parallelism lives in the outer
+# loops (predict_many, cross-validation) instead of oversubscribing the cores.
+MODEL_N_JOBS = int(os.environ.get('UFC_MODEL_N_JOBS', 1))
+
+# joblib compression for saved models: a level ("3"), a method ("lz4", at joblib's
+# default level) or "method:level" ("lz4:3").
+# 0 keeps them uncompressed, which the app needs to memory-map their arrays on load.
+_COMPRESS_METHODS = ('zlib', 'gzip', 'bz2', 'lzma', 'xz', 'lz4')
+
+def _parse_model_compress(value):
+    method, _, level = value.strip().partition(':')
+    try:
+        if method.isdigit() and not level:
+            return int(method)
+        if method in _COMPRESS_METHODS:
+            return (method, int(level)) if level else method
+    except ValueError:
+        pass
+    raise ValueError(
+        f"Invalid UFC_MODEL_COMPRESS={value!r}: expected a level (0-9), a method "
+        f"({', '.join(_COMPRESS_METHODS)}) or 'method:level'."
+    )
+
+MODEL_COMPRESS = _parse_model_compress(os.environ.get('UFC_MODEL_COMPRESS', '0'))
+# Protocol 5 pickles large buffers without extra copies
+MODEL_PICKLE_PROTOCOL = 5
+
 # Date formats
 DATE_FORMAT_EVENT = '%B %d, %Y'
 DATE_FORMAT_DOB = '%b %d, %Y'
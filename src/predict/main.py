@@ -12,18 +12,37 @@ from .models import (
 )
 
 # --- Define Models to Run ---
-# Instantiate all the models you want to evaluate here.
-MODELS_TO_RUN = [
-    EloBaselineModel(),
-    LogisticRegressionModel(),
-    # XGBoostModel(),
-    # SVCModel(),
-    # RandomForestModel(),
-    BernoulliNBModel(),
-    LGBMModel(),
-]
+# Every available model, by the short name used with --models. Models are only
+# instantiated for the names that are selected.
+MODEL_REGISTRY = {
+    'elo': EloBaselineModel,
+    'lr': LogisticRegressionModel,
+    'xgb': XGBoostModel,
+    'svc': SVCModel,
+    'rf': RandomForestModel,
+    'nb': BernoulliNBModel,
+    'lgbm': LGBMModel,
+}
+
+# The models evaluated when --models is not given.
+DEFAULT_MODELS = ['elo', 'lr', 'nb', 'lgbm']
 # --- End of Model Definition ---
 
+def build_models(model_names=None):
+    """
+    Instantiates the models with the given registry names, or the default
+    selection if no names are given.
+    """
+    names = model_names or DEFAULT_MODELS
+    unknown = [name for name in names if name not in MODEL_REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown model(s): {', '.join(unknown)}. Available: {', '.join(MODEL_REGISTRY)}")
+    return [MODEL_REGISTRY[name]() for name in names]
+
+def parse_model_names(value):
+    """Parses a comma-separated --models value into a list of registry names."""
+    return [name.strip() for name in value.split(',') if name.strip()]
+
 def main():
     """
     Main entry point to run the prediction pipeline.
@@ -55,6 +74,25 @@ def main():
         default=False,
         help="Force retrain all models even if no new data is available."
     )
+    parser.add_argument(
+        '--models',
+        type=parse_model_names,
+        default=None,
+        help=f"Comma-separated models to run (available: {', '.join(MODEL_REGISTRY)}; default: {','.join(DEFAULT_MODELS)})."
+    )
+    parser.add_argument(
+        '--deep-verify',
+        action='store_true',
+        default=False,
+        help="Fully load saved models to check them, instead of only checking their file headers."
+    )
+    parser.add_argument(
+        '--n-jobs',
+        type=int,
+        default=None,
+        help="Processes used to train models in parallel (-1 uses every core). By default models "
+             "are trained in one process, and k-fold CV runs its folds on every core."
+    )
     parser.add_argument(
         '--kfold',
         action='store_true',
@@ -73,19 +111,25 @@ def main():
     elif use_existing_models:
         print("Using existing models if available and no new data detected.")
 
-    # Use the already defined MODELS_TO_RUN from the top of the file
+    try:
+        models = build_models(args.models)
+    except ValueError as e:
+        parser.error(str(e))
 
     pipeline = PredictionPipeline(
-        models=MODELS_TO_RUN, 
+        models=models, 
         use_existing_models=use_existing_models,
-        force_retrain=force_retrain
+        force_retrain=force_retrain,
+        deep_verify=args.deep_verify
     )
+    # Without --n-jobs, each pipeline keeps its own default
+    n_jobs_kwargs = {} if args.n_jobs is None else {'n_jobs': args.n_jobs}
     try:
         if args.kfold:
-            cv_results = pipeline.run_kfold_cv(k=3, holdout_events=1)
+            cv_results = pipeline.run_kfold_cv(k=3, holdout_events=1, **n_jobs_kwargs)
             print(cv_results)
         else:
-            pipeline.run(detailed_report=(args.report == 'detailed'))
+            pipeline.run(detailed_report=(args.report == 'detailed'), **n_jobs_kwargs)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         print("Please ensure the required data files exist. You may need to run the scraping and ELO analysis first.")
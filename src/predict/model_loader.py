@@ -0,0 +1,69 @@
+import os
+import threading
+from collections import OrderedDict
+import joblib
+
+from ..config import MODELS_DIR
+
+# Maximum number of models kept in memory. The least recently used model is
+# evicted when a new one is loaded past this limit.
+MAX_CACHED_MODELS = int(os.environ.get('UFC_MAX_CACHED_MODELS', 4))
+
+# Loaded models keyed by file name, shared by every entry point in the process.
+# Ordered from least to most recently used.
+MODEL_CACHE = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _needs_writable_arrays(model):
+    """
+    True for models whose estimator cannot predict from read-only (memory-mapped) arrays.
+    libsvm's predict_proba, used by SVC with probability=True, requires writable buffers.
+    """
+    estimator = getattr(model, 'model', model)
+    return type(estimator).__module__.startswith('sklearn.svm')
+
+def get_model(model_name):
+    """
+    Returns the model saved as `model_name` in MODELS_DIR, loading it from disk
+    on first use. Safe to call from several threads at once.
+    """
+    with _cache_lock:
+        model = MODEL_CACHE.get(model_name)
+        if model is not None:
+            MODEL_CACHE.move_to_end(model_name)
+            return model
+
+        print(f"Loading and caching model: {model_name}...")
+        model_path = os.path.join(MODELS_DIR, model_name)
+        # Memory-map the numpy arrays inside the dump instead of copying them into RAM.
+        # Compressed dumps (UFC_MODEL_COMPRESS) cannot be memory-mapped and are read fully,
+        # as are models that need writable arrays to predict.
+        try:
+            model = joblib.load(model_path, mmap_mode='r')
+        except ValueError:
+            model = joblib.load(model_path)
+        else:
+            if _needs_writable_arrays(model):
+                model = joblib.load(model_path)
+        # Build the prediction lookup tables once here instead of on the first request
+        prime = getattr(model, '_prime', None)
+        if callable(prime):
+            prime()
+        MODEL_CACHE[model_name] = model
+        print("...model cached.")
+
+        while len(MODEL_CACHE) > MAX_CACHED_MODELS:
+            evicted_name, _ = MODEL_CACHE.popitem(last=False)
+            print(f"Evicted least recently used model from cache: {evicted_name}")
+    return model
+
+def preload_models(model_names):
+    """
+    Loads the given models into the cache, skipping any that fail to load.
+    At most MAX_CACHED_MODELS models are preloaded; the rest load on first use.
+    """
+    for model_name in list(model_names)[:MAX_CACHED_MODELS]:
+        try:
+            get_model(model_name)
+        except Exception as e:
+            print(f"Warning: Could not load model '{model_name}', skipping it: {e}")
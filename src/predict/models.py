@@ -1,25 +1,120 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 import sys
 import os
+import shutil
+import subprocess
+import threading
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, List
-from sklearn.linear_model import LogisticRegression
-from sklearn.svm import SVC
-from sklearn.naive_bayes import BernoulliNB
-from sklearn.ensemble import RandomForestClassifier
-from xgboost import XGBClassifier
-from lightgbm import LGBMClassifier
-from ..analysis.elo import process_fights_for_elo, INITIAL_ELO
+from joblib import Parallel, delayed
+from ..analysis.elo import process_fights_for_elo, INITIAL_ELO, ELO_EXP_SCALE
 from ..config import FIGHTERS_CSV_PATH
-from .preprocess import preprocess_for_ml, _get_fighter_history_stats
-from .utils import calculate_age, prepare_fighters_data
-from .config import DEFAULT_ELO
+from .preprocess import (
+    preprocess_for_ml_cached, _build_history_arrays, _get_history_stats_from_arrays, FEATURE_COLUMNS
+)
+from .utils import calculate_age, load_prepared_fighters, fights_fingerprint
+from .config import DEFAULT_ELO, MODEL_N_JOBS, DATE_FORMAT_EVENT
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str):
+    """Parses an event date once; the same dates recur across many predictions."""
+    return pd.Timestamp(date_str)
+
+@lru_cache(maxsize=1)
+def _gpu_available() -> bool:
+    """Returns True if a CUDA device is visible. Checked once per process."""
+    try:
+        import cupy
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        pass
+    if shutil.which('nvidia-smi') is None:
+        return False
+    try:
+        result = subprocess.run(['nvidia-smi', '-L'], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0 and 'GPU' in result.stdout
+
+# Prediction-time lookups built from a training split, shared by every model trained
+# on the same split in this process. They are read-only once built, except for the
+# per-fighter memo dicts, whose entries are deterministic.
+_SHARED_TRAINING_STATE = OrderedDict()
+_SHARED_TRAINING_STATE_SIZE = 2
+_SHARED_TRAINING_STATE_LOCK = threading.Lock()
+
+def _build_fighter_histories(train_fights):
+    """Buckets the fights by fighter, each history sorted by date."""
+    # One vectorized parse with the known format; recurring event dates are parsed once
+    fight_dates = pd.to_datetime(
+        [fight['event_date'] for fight in train_fights], format=DATE_FORMAT_EVENT, cache=True
+    )
+    for fight, date_obj in zip(train_fights, fight_dates):
+        fight['date_obj'] = date_obj
+    # The fights are sorted by date once (stably), so bucketing them in that order
+    # leaves every history already sorted
+    histories = defaultdict(list)
+    for idx in np.argsort(fight_dates.values, kind='mergesort'):
+        fight = train_fights[idx]
+        histories[fight['fighter_1']].append(fight)
+        if fight['fighter_2'] != fight['fighter_1']:
+            histories[fight['fighter_2']].append(fight)
+    return dict(histories)
+
+# Numeric fighter attributes copied into the fixed-position table, with the value
+# used when the prepared data lacks the column
+_FIGHTER_TABLE_COLUMNS = (('elo', 1500), ('height_cm', 0), ('reach_in', 0))
+
+def _build_fighter_table(fighters_df):
+    """
+    Lays the prepared fighters out for prediction: a name -> row dict, a float matrix
+    of the _FIGHTER_TABLE_COLUMNS, and object arrays for date of birth and stance.
+    """
+    n_fighters = len(fighters_df)
+    stats = np.empty((n_fighters, len(_FIGHTER_TABLE_COLUMNS)), dtype=np.float64)
+    for col, (name, default) in enumerate(_FIGHTER_TABLE_COLUMNS):
+        stats[:, col] = fighters_df[name].to_numpy(dtype=np.float64) if name in fighters_df else default
+    missing = np.full(n_fighters, None, dtype=object)
+    return {
+        'row_by_name': {name: row for row, name in enumerate(fighters_df.index)},
+        'stats': stats,
+        'dob': fighters_df['dob'].to_numpy(dtype=object) if 'dob' in fighters_df else missing,
+        'stance': fighters_df['stance'].to_numpy(dtype=object) if 'stance' in fighters_df else missing,
+    }
+
+def _get_shared_training_state(train_fights, train_hash, fighters_df):
+    """
+    Returns the fighter histories and lookup tables for a training split, building them
+    only for the first model trained on it. The hash covers the fighters file version.
+    """
+    with _SHARED_TRAINING_STATE_LOCK:
+        state = _SHARED_TRAINING_STATE.get(train_hash)
+        if state is None:
+            state = {
+                'fighter_histories': _build_fighter_histories(train_fights),
+                'fighter_table': _build_fighter_table(fighters_df),
+                'elo_by_name': fighters_df['elo'].to_dict(),
+                'history_arrays': {},
+                'hist_cache': {},
+            }
+            _SHARED_TRAINING_STATE[train_hash] = state
+            while len(_SHARED_TRAINING_STATE) > _SHARED_TRAINING_STATE_SIZE:
+                _SHARED_TRAINING_STATE.popitem(last=False)
+        else:
+            _SHARED_TRAINING_STATE.move_to_end(train_hash)
+    return state
 
 class BaseModel(ABC):
     """
     Abstract base class for all prediction models.
     Ensures that every model has a standard interface for training and prediction.
     """
+    # Fingerprint of the fights the model was last trained on (see fights_fingerprint)
+    train_hash = None
+
     @abstractmethod
     def train(self, train_fights):
         """
@@ -39,12 +134,48 @@ class BaseModel(ABC):
         """
         pass
 
+    def predict_batch(self, fights):
+        """
+        Predicts the winners of several fights.
+
+        :param fights: A list of fight dictionaries.
+        :return: A list with one prediction dictionary per fight, in the same order.
+        """
+        return [self.predict(fight) for fight in fights]
+
+    def predict_many(self, fights):
+        """
+        Predicts a large collection of fights. Models that can spread inference
+        over several processes override this; by default it is predict_batch.
+        """
+        return self.predict_batch(fights)
+
+    def _fill_results(self, results, fights, predicted_idx, prob_f1_wins):
+        """
+        Turns fighter-1 win probabilities into prediction dicts for the fights at
+        predicted_idx. The winner side and its probability are selected for the
+        whole batch at once.
+        """
+        f1_wins = prob_f1_wins >= 0.5
+        probabilities = np.where(f1_wins, prob_f1_wins, 1 - prob_f1_wins)
+        for i, f1_won, probability in zip(predicted_idx, f1_wins.tolist(), probabilities.tolist()):
+            fight = fights[i]
+            results[i] = {'winner': fight['fighter_1'] if f1_won else fight['fighter_2'], 'probability': probability}
+
+    def _prime(self):
+        """
+        Builds the lookup tables used at prediction time. Called after training and
+        after a model is loaded from disk, so predictions avoid pandas indexing.
+        """
+        pass
+
 class EloBaselineModel(BaseModel):
     """
     A baseline prediction model that predicts the winner based on the higher ELO rating.
     """
     def __init__(self):
         self.fighters_df = None
+        self._elo_by_name = None
 
     def train(self, train_fights):
         """
@@ -52,41 +183,93 @@ class EloBaselineModel(BaseModel):
         to access their ELO scores during prediction.
         """
         print("Training EloBaselineModel: Loading fighter ELO data...")
-        self.fighters_df = pd.read_csv(FIGHTERS_CSV_PATH)
-        self.fighters_df['full_name'] = self.fighters_df['first_name'] + ' ' + self.fighters_df['last_name']
-        self.fighters_df = self.fighters_df.drop_duplicates(subset=['full_name']).set_index('full_name')
+        self.fighters_df = load_prepared_fighters(FIGHTERS_CSV_PATH)
+        self._prime()
+        self.train_hash = fights_fingerprint(train_fights, FIGHTERS_CSV_PATH)
+
+    def _prime(self):
+        """Builds a plain name -> ELO dict for prediction-time lookups."""
+        self._elo_by_name = self.fighters_df['elo'].to_dict()
 
     def predict(self, fight: Dict[str, Any]) -> Dict[str, Optional[float]]:
         """Predicts the winner based on ELO and calculates win probability."""
-        f1_name, f2_name = fight['fighter_1'], fight['fighter_2']
-        
-        try:
-            f1_elo = self.fighters_df.loc[f1_name, 'elo']
-            f2_elo = self.fighters_df.loc[f2_name, 'elo']
-            
-            # Calculate win probability for fighter 1 using the ELO formula
-            prob_f1_wins = 1 / (1 + 10**((f2_elo - f1_elo) / 400))
-
-            if prob_f1_wins >= 0.5:
-                return {'winner': f1_name, 'probability': prob_f1_wins}
+        return self.predict_batch([fight])[0]
+
+    def predict_batch(self, fights):
+        """
+        Predicts several fights at once. ELOs are gathered into arrays and the
+        win probabilities are computed in a single vectorized step. This is also
+        the path used by predict() and predict_many().
+        """
+        if getattr(self, '_elo_by_name', None) is None:
+            self._prime()
+
+        results = [None] * len(fights)
+        pending_idx, f1_elos, f2_elos = [], [], []
+        for i, fight in enumerate(fights):
+            f1_name, f2_name = fight['fighter_1'], fight['fighter_2']
+            f1_elo = self._elo_by_name.get(f1_name)
+            f2_elo = self._elo_by_name.get(f2_name)
+            if f1_elo is None or f2_elo is None:
+                missing = f1_name if f1_elo is None else f2_name
+                print(f"Warning: Could not find ELO for fighter '{missing}'. Skipping prediction.")
+                results[i] = {'winner': None, 'probability': None}
             else:
-                return {'winner': f2_name, 'probability': 1 - prob_f1_wins}
+                pending_idx.append(i)
+                f1_elos.append(f1_elo)
+                f2_elos.append(f2_elo)
+
+        if not pending_idx:
+            return results
 
-        except KeyError as e:
-            print(f"Warning: Could not find ELO for fighter {e}. Skipping prediction.")
-            return {'winner': None, 'probability': None}
+        f1_elos = np.array(f1_elos, dtype=np.float64)
+        f2_elos = np.array(f2_elos, dtype=np.float64)
+        prob_f1_wins = 1.0 / (1.0 + np.exp((f2_elos - f1_elos) * ELO_EXP_SCALE))
+        self._fill_results(results, fights, pending_idx, prob_f1_wins)
+        return results
 
 class BaseMLModel(BaseModel):
     """
     An abstract base class for machine learning models that handles all common
     data preparation, training, and prediction logic.
     """
-    def __init__(self, model):
+    # Below this many fights, starting worker processes costs more than it saves
+    PARALLEL_PREDICT_THRESHOLD = 2000
+
+    # Threads given to estimators that support it; override per class if needed
+    N_JOBS = MODEL_N_JOBS
+
+    # Dtype of the feature matrix passed to fit and predict. Tree learners bin or
+    # compare features in float32 internally, so they are handed float32 directly.
+    FEATURE_DTYPE = np.float64
+
+    # Column order of the feature matrix, matching preprocess_for_ml
+    FEATURE_ORDER = FEATURE_COLUMNS
+    # Positions of the difference features and of the stance flag within FEATURE_ORDER;
+    # the differences are taken between the per-fighter stats listed in _FIGHTER_STATS
+    _STANCE_COLUMN = 4
+    _DIFF_COLUMNS = [0, 1, 2, 3, 5, 6, 7, 8, 9, 10]
+    _FIGHTER_STATS = (
+        'elo', 'height_cm', 'reach_in', 'age', 'wins_last_n', 'avg_opp_elo_last_n',
+        'ko_percent_last_n', 'sig_str_landed_per_min_last_n', 'takedown_accuracy_last_n',
+        'sub_attempts_per_min_last_n',
+    )
+
+    def __init__(self, model, cpu_fallback_params=None):
         if model is None:
             raise ValueError("A model must be provided.")
         self.model = model
+        # Parameters that move the estimator back to the CPU if fitting on the GPU fails
+        self.cpu_fallback_params = cpu_fallback_params
         self.fighters_df = None
         self.fighter_histories = {}
+        self._fighter_table = None
+        self._elo_by_name = None
+        self._feature_order = None
+        # History stats per (fighter, fight date); only valid for the current training run
+        self._hist_cache = {}
+        # Column-wise (SoA) copies of fighter_histories, built per fighter on first use
+        self._history_arrays = {}
 
     def train(self, train_fights: List[Dict[str, Any]]) -> None:
         """
@@ -95,101 +278,249 @@ class BaseMLModel(BaseModel):
         """
         print(f"--- Training {self.model.__class__.__name__} ---")
         
-        # 1. Prepare data for prediction-time feature generation
-        self.fighters_df = prepare_fighters_data(pd.read_csv(FIGHTERS_CSV_PATH))
-
-        # 2. Pre-calculate fighter histories
-        train_fights_with_dates = []
-        for fight in train_fights:
-            fight['date_obj'] = pd.to_datetime(fight['event_date'])
-            train_fights_with_dates.append(fight)
-        for fighter_name in self.fighters_df.index:
-            history = [f for f in train_fights_with_dates if fighter_name in (f['fighter_1'], f['fighter_2'])]
-            self.fighter_histories[fighter_name] = sorted(history, key=lambda x: x['date_obj'])
-
-        # 3. Preprocess and fit
-        X_train, y_train, _ = preprocess_for_ml(train_fights, FIGHTERS_CSV_PATH)
+        # 1. Prepare data for prediction-time feature generation. The fighters table,
+        # histories and lookups are shared with other models trained on the same fights.
+        self.fighters_df = load_prepared_fighters(FIGHTERS_CSV_PATH)
+        train_hash = fights_fingerprint(train_fights, FIGHTERS_CSV_PATH)
+        shared = _get_shared_training_state(train_fights, train_hash, self.fighters_df)
+
+        # 2. Preprocess and fit. The feature matrix is reused across runs on unchanged data
+        X_train, y_train, _ = preprocess_for_ml_cached(train_fights, FIGHTERS_CSV_PATH, train_hash)
         print(f"Fitting model on {X_train.shape[0]} samples...")
-        self.model.fit(X_train, y_train)
+        # Fit on a plain array so prediction can pass ndarrays without column alignment
+        self._feature_order = list(X_train.columns)
+        self._fit(X_train.to_numpy(dtype=self.FEATURE_DTYPE), y_train.to_numpy(dtype=np.int8))
+
+        self.fighter_histories = shared['fighter_histories']
+        self._fighter_table = shared['fighter_table']
+        self._elo_by_name = shared['elo_by_name']
+        self._history_arrays = shared['history_arrays']
+        self._hist_cache = shared['hist_cache']
+        self.train_hash = train_hash
         print("Model training complete.")
 
+    def _fit(self, X_train, y_train):
+        """Fits the estimator, retrying on the CPU if GPU training is unavailable."""
+        fallback_params = getattr(self, 'cpu_fallback_params', None)
+        try:
+            self.model.fit(X_train, y_train)
+        except Exception as e:
+            if not fallback_params:
+                raise
+            print(f"Warning: GPU training failed ({e}). Falling back to CPU.")
+            self.model.set_params(**fallback_params)
+            self.cpu_fallback_params = None
+            self.model.fit(X_train, y_train)
+
+    def _prime(self):
+        """Builds the fighter table and ELO dict used for prediction-time lookups."""
+        self._fighter_table = _build_fighter_table(self.fighters_df)
+        self._elo_by_name = self.fighters_df['elo'].to_dict()
+
     def predict(self, fight):
         """
         Predicts the outcome of a single fight, returning the winner and probability.
         """
+        return self.predict_batch([fight])[0]
+
+    def predict_batch(self, fights):
+        """
+        Predicts several fights at once. Per-fighter stats are gathered per fight, the
+        features are derived from them in one vectorized step, and the model is called
+        a single time on the whole matrix.
+        """
+        # Models saved before the lookup tables existed are primed on first use
+        if getattr(self, '_fighter_table', None) is None:
+            self._prime()
+
+        results = [None] * len(fights)
+        f1_idx, f2_idx, f1_rows, f2_rows, predicted_idx = [], [], [], [], []
+        for i, fight in enumerate(fights):
+            stat_rows = self._fighter_stat_rows(fight)
+            if stat_rows is None:
+                results[i] = {'winner': None, 'probability': None}
+            else:
+                f1_idx.append(stat_rows[0])
+                f2_idx.append(stat_rows[1])
+                f1_rows.append(stat_rows[2])
+                f2_rows.append(stat_rows[3])
+                predicted_idx.append(i)
+
+        if not predicted_idx:
+            return results
+
+        # Models saved before the feature order was stored use the default order
+        feature_order = getattr(self, '_feature_order', None) or self.FEATURE_ORDER
+        table = self._fighter_table
+        # Static attributes come straight from the fighter table rows
+        f1_stats = np.hstack((table['stats'][f1_idx], np.array(f1_rows, dtype=np.float64)))
+        f2_stats = np.hstack((table['stats'][f2_idx], np.array(f2_rows, dtype=np.float64)))
+        stance_flags = (table['stance'][f1_idx] != table['stance'][f2_idx]).astype(np.float64)
+        feature_matrix = self._compose_features(f1_stats, f2_stats, stance_flags, feature_order)
+
+        prob_f1_wins = self._predict_f1_probabilities(feature_matrix)
+        self._fill_results(results, fights, predicted_idx, prob_f1_wins)
+        return results
+
+    def _predict_f1_probabilities(self, feature_matrix):
+        """
+        Returns the probability that fighter 1 wins for each row of the feature matrix.
+        Estimators without predict_proba (e.g. SVC with probability=False) get a heuristic
+        confidence from a sigmoid over their decision function; it ranks fights the same
+        way but is not calibrated.
+        """
+        if hasattr(self.model, 'predict_proba'):
+            # Use predict_proba to get probabilities for each class
+            return self.model.predict_proba(feature_matrix)[:, 1]  # Probability of class '1' (fighter 1 wins)
+        margins = self.model.decision_function(feature_matrix)
+        return 1.0 / (1.0 + np.exp(-margins))
+
+    def predict_many(self, fights, n_jobs=-1):
+        """
+        Predicts many fights by splitting them into one chunk per available core
+        and running predict_batch on each chunk in a separate process.
+        """
+        if len(fights) < self.PARALLEL_PREDICT_THRESHOLD:
+            return self.predict_batch(fights)
+
+        if hasattr(os, 'sched_getaffinity'):
+            n_cores = len(os.sched_getaffinity(0))
+        else:
+            n_cores = os.cpu_count() or 1
+        if n_cores < 2:
+            return self.predict_batch(fights)
+
+        chunks = [fights[c[0]:c[-1] + 1] for c in np.array_split(np.arange(len(fights)), n_cores) if len(c)]
+        chunk_results = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(self.predict_batch)(chunk) for chunk in chunks
+        )
+        return [result for chunk_result in chunk_results for result in chunk_result]
+
+    def _fighter_stat_rows(self, fight):
+        """
+        Looks up both fighters of a fight, returning their fighter table rows and their
+        date-dependent stats (age, then history) in _FIGHTER_STATS order, or None if a
+        fighter is unknown.
+        """
         f1_name, f2_name = fight['fighter_1'], fight['fighter_2']
-        fight_date = pd.to_datetime(fight['event_date'])
+        fight_date = _parse_date(fight['event_date'])
 
-        if f1_name not in self.fighters_df.index or f2_name not in self.fighters_df.index:
+        table = self._fighter_table
+        f1_row = table['row_by_name'].get(f1_name)
+        f2_row = table['row_by_name'].get(f2_name)
+        if f1_row is None or f2_row is None:
             print(f"Warning: Fighter not found. Skipping prediction for {f1_name} vs {f2_name}")
-            return {'winner': None, 'probability': None}
+            return None
 
-        f1_stats = self.fighters_df.loc[f1_name]
-        f2_stats = self.fighters_df.loc[f2_name]
-        if isinstance(f1_stats, pd.DataFrame): f1_stats = f1_stats.iloc[0]
-        if isinstance(f2_stats, pd.DataFrame): f2_stats = f2_stats.iloc[0]
-        
-        f1_hist = self.fighter_histories.get(f1_name, [])
-        f2_hist = self.fighter_histories.get(f2_name, [])
-        f1_hist_stats = _get_fighter_history_stats(f1_name, fight_date, f1_hist, self.fighters_df)
-        f2_hist_stats = _get_fighter_history_stats(f2_name, fight_date, f2_hist, self.fighters_df)
-        
-        f1_age = calculate_age(f1_stats.get('dob'), fight['event_date'])
-        f2_age = calculate_age(f2_stats.get('dob'), fight['event_date'])
-
-        features = {
-            'elo_diff': f1_stats.get('elo', 1500) - f2_stats.get('elo', 1500),
-            'height_diff_cm': f1_stats.get('height_cm', 0) - f2_stats.get('height_cm', 0),
-            'reach_diff_in': f1_stats.get('reach_in', 0) - f2_stats.get('reach_in', 0),
-            'age_diff_years': (f1_age - f2_age) if f1_age and f2_age else 0,
-            'stance_is_different': 1 if f1_stats.get('stance') != f2_stats.get('stance') else 0,
-            'wins_last_5_diff': f1_hist_stats['wins_last_n'] - f2_hist_stats['wins_last_n'],
-            'avg_opp_elo_last_5_diff': f1_hist_stats['avg_opp_elo_last_n'] - f2_hist_stats['avg_opp_elo_last_n'],
-            'ko_percent_last_5_diff': f1_hist_stats['ko_percent_last_n'] - f2_hist_stats['ko_percent_last_n'],
-            'sig_str_landed_per_min_last_5_diff': f1_hist_stats['sig_str_landed_per_min_last_n'] - f2_hist_stats['sig_str_landed_per_min_last_n'],
-            'takedown_accuracy_last_5_diff': f1_hist_stats['takedown_accuracy_last_n'] - f2_hist_stats['takedown_accuracy_last_n'],
-            'sub_attempts_per_min_last_5_diff': f1_hist_stats['sub_attempts_per_min_last_n'] - f2_hist_stats['sub_attempts_per_min_last_n'],
-        }
-        
-        feature_vector = pd.DataFrame([features]).fillna(0)
-        
-        # Use predict_proba to get probabilities for each class
-        probabilities = self.model.predict_proba(feature_vector)[0]
-        prob_f1_wins = probabilities[1]  # Probability of class '1' (fighter 1 wins)
+        # Models saved before the history cache existed get an empty one on first use
+        hist_cache = getattr(self, '_hist_cache', None)
+        if hist_cache is None:
+            hist_cache = self._hist_cache = {}
 
-        if prob_f1_wins >= 0.5:
-            return {'winner': f1_name, 'probability': prob_f1_wins}
-        else:
-            return {'winner': f2_name, 'probability': 1 - prob_f1_wins}
+        rows = []
+        for name, row in ((f1_name, f1_row), (f2_name, f2_row)):
+            hist_stats = hist_cache.get((name, fight_date))
+            if hist_stats is None:
+                hist_stats = _get_history_stats_from_arrays(self._get_history_arrays(name), fight_date)
+                hist_cache[(name, fight_date)] = hist_stats
+            rows.append((
+                calculate_age(table['dob'][row], fight_date),
+                hist_stats['wins_last_n'], hist_stats['avg_opp_elo_last_n'],
+                hist_stats['ko_percent_last_n'], hist_stats['sig_str_landed_per_min_last_n'],
+                hist_stats['takedown_accuracy_last_n'], hist_stats['sub_attempts_per_min_last_n'],
+            ))
+        return f1_row, f2_row, rows[0], rows[1]
+
+    def _get_history_arrays(self, fighter_name):
+        """Returns the fighter's history as per-field arrays, converting it on first use."""
+        # Models saved before the arrays existed get an empty store on first use
+        history_arrays = getattr(self, '_history_arrays', None)
+        if history_arrays is None:
+            history_arrays = self._history_arrays = {}
+        arrays = history_arrays.get(fighter_name)
+        if arrays is None:
+            arrays = _build_history_arrays(
+                fighter_name, self.fighter_histories.get(fighter_name, []), self._elo_by_name
+            )
+            history_arrays[fighter_name] = arrays
+        return arrays
+
+    def _compose_features(self, f1_rows, f2_rows, stance_flags, feature_order):
+        """
+        Turns the per-fighter stat arrays into the feature matrix in one vectorized step:
+        every feature except the stance flag is a fighter 1 minus fighter 2 difference.
+        A missing value (e.g. an unknown age) makes its difference 0.
+        """
+        feature_matrix = np.empty((len(stance_flags), len(self.FEATURE_ORDER)), dtype=self.FEATURE_DTYPE)
+        feature_matrix[:, self._DIFF_COLUMNS] = f1_rows - f2_rows
+        feature_matrix[:, self._STANCE_COLUMN] = stance_flags
+        feature_matrix[np.isnan(feature_matrix)] = 0
+        if tuple(feature_order) != self.FEATURE_ORDER:
+            feature_matrix = feature_matrix[:, [self.FEATURE_ORDER.index(name) for name in feature_order]]
+        return feature_matrix
+
+# Estimator libraries are imported inside each constructor, so only the models
+# that are actually used pay their import cost.
 
 class LogisticRegressionModel(BaseMLModel):
     """A thin wrapper for scikit-learn's LogisticRegression."""
     def __init__(self):
-        super().__init__(model=LogisticRegression())
+        from sklearn.linear_model import LogisticRegression
+        # liblinear is the fastest solver for this small, dense feature set
+        super().__init__(model=LogisticRegression(solver='liblinear', dual=False, C=1.0, tol=1e-3, random_state=42))
 
 class XGBoostModel(BaseMLModel):
     """A thin wrapper for XGBoost's XGBClassifier."""
+    FEATURE_DTYPE = np.float32
+
     def __init__(self):
-        model = XGBClassifier(use_label_encoder=False, eval_metric='logloss', random_state=42)
-        super().__init__(model=model)
+        from xgboost import XGBClassifier
+        params = dict(
+            use_label_encoder=False, eval_metric='logloss', random_state=42,
+            tree_method='hist', max_bin=128, n_jobs=self.N_JOBS
+        )
+        fallback = None
+        if _gpu_available():
+            params['device'] = 'cuda'
+            fallback = {'device': 'cpu'}
+        super().__init__(model=XGBClassifier(**params), cpu_fallback_params=fallback)
 
 class SVCModel(BaseMLModel):
     """A thin wrapper for scikit-learn's Support Vector Classifier."""
     def __init__(self):
-        # Probability=True is needed for some reports, though it slows down training
-        super().__init__(model=SVC(probability=True, random_state=42))
+        from sklearn.svm import SVC
+        # probability=True would run an internal 5-fold Platt calibration on every fit;
+        # confidences are derived from the decision function instead
+        super().__init__(model=SVC(probability=False, random_state=42, cache_size=500))
 
 class RandomForestModel(BaseMLModel):
     """A thin wrapper for scikit-learn's RandomForestClassifier."""
+    FEATURE_DTYPE = np.float32
+
     def __init__(self):
-        super().__init__(model=RandomForestClassifier(random_state=42))
+        from sklearn.ensemble import RandomForestClassifier
+        super().__init__(model=RandomForestClassifier(
+            n_estimators=100, max_features='sqrt', random_state=42, n_jobs=self.N_JOBS
+        ))
 
 class BernoulliNBModel(BaseMLModel):
     """A thin wrapper for scikit-learn's Bernoulli Naive Bayes classifier."""
     def __init__(self):
+        from sklearn.naive_bayes import BernoulliNB
         super().__init__(model=BernoulliNB())
 
 class LGBMModel(BaseMLModel):
     """A thin wrapper for LightGBM's LGBMClassifier."""
+    FEATURE_DTYPE = np.float32
+
     def __init__(self):
-        super().__init__(model=LGBMClassifier(random_state=42))
\ No newline at end of file
+        from lightgbm import LGBMClassifier
+        # force_row_wise skips LightGBM's per-fit row/col-wise probe, which also logs a warning
+        params = dict(force_row_wise=True, num_leaves=31, random_state=42, n_jobs=self.N_JOBS, verbosity=-1)
+        fallback = None
+        # Requires a GPU-enabled LightGBM build; other builds fall back to the CPU
+        if _gpu_available():
+            params.pop('force_row_wise')
+            params['device'] = 'gpu'
+            fallback = {'device': 'cpu', 'force_row_wise': True}
+        super().__init__(model=LGBMClassifier(**params), cpu_fallback_params=fallback)
\ No newline at end of file
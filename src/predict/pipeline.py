@@ -17,78 +17,213 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import copy
 import csv
 import os
+import sys
 from datetime import datetime
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 import json
+import orjson
 import joblib
-from ..config import FIGHTS_CSV_PATH, MODEL_RESULTS_PATH, MODELS_DIR, LAST_EVENT_JSON_PATH
+from joblib import Parallel, delayed, effective_n_jobs
+import pandas as pd
+import sklearn
+from ..config import (
+    FIGHTS_CSV_PATH, MODEL_RESULTS_PATH, MODELS_DIR, LAST_EVENT_JSON_PATH, TRAINED_MODELS_CACHE_DIR
+)
+from . import models as _models_module, preprocess as _preprocess_module, utils as _utils_module
 from .models import BaseModel
+from .utils import fights_fingerprint
+from .config import DATE_FORMAT_EVENT, MODEL_COMPRESS, MODEL_PICKLE_PROTOCOL
 from sklearn.model_selection import KFold
 import mlflow
 import mlflow.sklearn
 
+_MONTHS = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
+    'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12,
+}
+
+@lru_cache(maxsize=None)
+def _parse_event_date(event_date: str) -> tuple:
+    """
+    Turns an event date like 'March 4, 2023' into a (year, month, day) tuple that sorts
+    chronologically. The fixed format is split by hand instead of going through strptime;
+    anything unexpected falls back to it. Many fights share an event, so each date is parsed once.
+    """
+    try:
+        month_name, rest = event_date.split(' ', 1)
+        day, year = rest.split(', ')
+        return int(year), _MONTHS[month_name], int(day)
+    except (KeyError, ValueError):
+        parsed = datetime.strptime(event_date, DATE_FORMAT_EVENT)
+        return parsed.year, parsed.month, parsed.day
+
+# Leading bytes of a joblib dump: a pickle protocol marker when uncompressed, otherwise
+# the header of one of joblib's compressors (zlib, gzip, bz2, xz, lzma, lz4)
+_MODEL_FILE_MAGICS = (b'\x80', b'\x78', b'\x1f\x8b', b'BZh', b'\xfd7zXZ', b'\x5d\x00\x00', b'\x04\x22\x4d\x18')
+_MODEL_MAGIC_LENGTH = max(len(magic) for magic in _MODEL_FILE_MAGICS)
+
+# Source files of the feature and model code that trained models depend on
+_MODEL_CODE_FILES = (_preprocess_module.__file__, _utils_module.__file__, _models_module.__file__)
+
+def _dump_model(model, path):
+    """
+    Saves a model with the configured compression. Uncompressed by default, so the app
+    can memory-map its arrays on load; compressed files are smaller but load fully into memory.
+    """
+    joblib.dump(model, path, compress=MODEL_COMPRESS, protocol=MODEL_PICKLE_PROTOCOL)
+
+# Winner values of fights without a definitive outcome, which cannot be scored
+_BAD_WINNERS = frozenset(("Draw", "NC", ""))
+
+def _definitive_fights(fights):
+    """Keeps the fights that have a winner."""
+    return [f for f in fights if f['winner'] not in _BAD_WINNERS]
+
+def _partition_by_event(fights, test_events):
+    """Splits fights in one pass into those outside and those inside the `test_events` set."""
+    train, test = [], []
+    for fight in fights:
+        (test if fight['event_name'] in test_events else train).append(fight)
+    return train, test
+
+def _n_workers(n_jobs, n_tasks):
+    """Number of worker processes for `n_tasks` independent tasks: never more than the tasks."""
+    return max(1, min(effective_n_jobs(n_jobs), n_tasks))
+
+def _count_correct(fights, predictions):
+    """Number of fights whose predicted winner matches the actual winner."""
+    return sum(prediction.get('winner') == fight['winner'] for fight, prediction in zip(fights, predictions))
+
+def _train_model(model, train_fights):
+    """Trains a model and returns it, so it can be trained in a worker process."""
+    print(f"Training {model.__class__.__name__}...")
+    model.train(train_fights)
+    return model
+
+def _run_fold(models, experiment_id, fold_idx, n_train_events, holdout_events, train_set, test_set):
+    """
+    Trains and scores a fresh copy of every model on one cross-validation fold, inside its
+    own MLflow run of the experiment `experiment_id`. Returns the accuracy per model name
+    and the trained models.
+    """
+    # Each fold trains its own copies, so a fold's best model is not retrained by a later fold
+    models = [copy.deepcopy(model) for model in models]
+
+    # Start an MLflow run for the current fold. The experiment is passed by id: workers
+    # setting it themselves would race to create it on a first run.
+    with mlflow.start_run(experiment_id=experiment_id, run_name=f"fold_{fold_idx}"):
+        # Log meta information about the fold
+        mlflow.log_param("fold", fold_idx)
+        mlflow.log_param("train_events", n_train_events)
+        mlflow.log_param("test_events", holdout_events)
+
+        fold_results, fold_models = {}, {}
+        for model in models:
+            model_name = model.__class__.__name__
+
+            # Train and evaluate; the test set is predicted in one batch
+            model.train(train_set)
+            correct = _count_correct(test_set, model.predict_many(test_set))
+
+            acc = correct / len(test_set) if test_set else 0.0
+            fold_results[model_name] = acc
+            fold_models[model_name] = model
+            mlflow.log_metric(f"accuracy_{model_name}", acc)
+
+    return fold_results, fold_models
+
 class PredictionPipeline:
     """
     Orchestrates the model training, evaluation, and reporting pipeline.
     """
-    def __init__(self, models, use_existing_models=True, force_retrain=False):
+    def __init__(self, models, use_existing_models=True, force_retrain=False, deep_verify=False):
         if not all(isinstance(m, BaseModel) for m in models):
             raise TypeError("All models must be instances of BaseModel.")
         self.models = models
         self.train_fights = []
         self.test_fights = []
+        self.train_hash = None
         self.results = {}
         self.use_existing_models = use_existing_models
         self.force_retrain = force_retrain
-
-    def _get_last_trained_event(self):
-        """Get the last event that models were trained on."""
-        if not os.path.exists(LAST_EVENT_JSON_PATH):
-            return None
+        # Fully load saved models when checking that they exist, instead of checking headers
+        self.deep_verify = deep_verify
+        # (mtime, fights) of the last read of the fights CSV, sorted by date
+        self._fights_cache = None
+        # Saved models already deserialized by this pipeline: path -> (mtime, model)
+        self._loaded_models = {}
+        # (mtime, record) of the last read of the last-trained-event file
+        self._last_event_cache = None
+
+    def _get_last_trained_record(self):
+        """
+        Get the saved record of the last training run, or an empty dict if there is none.
+        The parsed record is reused until the file changes.
+        """
+        try:
+            mtime = os.path.getmtime(LAST_EVENT_JSON_PATH)
+        except OSError:
+            return {}
+        if self._last_event_cache is not None and self._last_event_cache[0] == mtime:
+            return self._last_event_cache[1]
         try:
             with open(LAST_EVENT_JSON_PATH, 'r', encoding='utf-8') as f:
                 last_event_data = json.load(f)
-                if isinstance(last_event_data, list) and len(last_event_data) > 0:
-                    return last_event_data[0].get('name'), last_event_data[0].get('date')
-                return None, None
         except (json.JSONDecodeError, FileNotFoundError):
-            return None, None
-
-    def _save_last_trained_event(self, event_name, event_date):
-        """Save the last event that models were trained on."""
+            return {}
+        record = {}
+        if isinstance(last_event_data, list) and len(last_event_data) > 0:
+            record = last_event_data[0]
+        self._last_event_cache = (mtime, record)
+        return record
+
+    def _save_last_trained_event(self, event_name, event_date, csv_mtime=None):
+        """
+        Save the last event that models were trained on, with the modification time of
+        the fights CSV it was read from.
+        """
         last_event_data = [{
             "name": event_name,
             "date": event_date,
+            "csv_mtime": csv_mtime,
             "training_timestamp": datetime.now().isoformat()
         }]
+        # Written to a temporary file and moved into place, so an interrupted save never
+        # leaves a truncated record behind (which would force a full retrain)
+        tmp_path = LAST_EVENT_JSON_PATH + '.tmp'
         try:
-            with open(LAST_EVENT_JSON_PATH, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(last_event_data, f, indent=4)
+            os.replace(tmp_path, LAST_EVENT_JSON_PATH)
         except Exception as e:
             print(f"Warning: Could not save last trained event: {e}")
+        finally:
+            # Only left over if the save failed before the replace
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _has_new_data_since_last_training(self):
         """Check if there's new fight data since the last training."""
-        last_event_name, last_event_date = self._get_last_trained_event()
+        record = self._get_last_trained_record()
+        last_event_name, last_event_date = record.get('name'), record.get('date')
         if not last_event_name or not last_event_date:
             return True  # No previous training record, consider as new data
         
         if not os.path.exists(FIGHTS_CSV_PATH):
             return False
-        
-        with open(FIGHTS_CSV_PATH, 'r', encoding='utf-8') as f:
-            fights = list(csv.DictReader(f))
-        
-        if not fights:
+
+        # The file has not been touched since that training, so it holds no new events
+        if record.get('csv_mtime') == os.path.getmtime(FIGHTS_CSV_PATH):
             return False
         
-        # Sort fights by date to get the latest event
-        fights.sort(key=lambda x: datetime.strptime(x['event_date'], '%B %d, %Y'))
-        latest_fight = fights[-1]
-        latest_event_name = latest_fight['event_name']
-        latest_event_date = latest_fight['event_date']
+        latest_event = self._find_latest_event()
+        if latest_event is None:
+            return False
+        latest_event_name, latest_event_date = latest_event
         
         # Check if we have new events since last training
         if latest_event_name != last_event_name:
@@ -97,36 +232,126 @@ class PredictionPipeline:
         
         return False
 
+    def _find_latest_event(self):
+        """
+        Returns the (name, date) of the latest event in the fights CSV, or None if it has
+        no fights. Uses the sorted fights when they are already loaded; otherwise only the
+        two event columns are read, without building or sorting the full list.
+        """
+        mtime = os.path.getmtime(FIGHTS_CSV_PATH)
+        if self._fights_cache is not None and self._fights_cache[0] == mtime:
+            fights = self._fights_cache[1]
+            if not fights:
+                return None
+            return fights[-1]['event_name'], fights[-1]['event_date']
+
+        try:
+            events = pd.read_csv(
+                FIGHTS_CSV_PATH, usecols=['event_name', 'event_date'], dtype=str, keep_default_na=False
+            )
+        except pd.errors.EmptyDataError:
+            return None
+        if events.empty:
+            return None
+        event_dates = pd.to_datetime(events['event_date'], format=DATE_FORMAT_EVENT, cache=True).to_numpy()
+        # argmax over the reversed dates finds the last row among equal dates, like the stable sort does
+        latest = len(event_dates) - 1 - int(event_dates[::-1].argmax())
+        return events['event_name'].iat[latest], events['event_date'].iat[latest]
+
     def _model_exists(self, model):
-        """Check if a saved model file exists and can be loaded successfully."""
+        """
+        Check if a saved model file exists and looks loadable: it must start like a pickle
+        or a joblib-compressed file. With deep_verify the file is fully loaded instead.
+        """
         model_name = model.__class__.__name__
         file_name = f"{model_name}.joblib"
         save_path = os.path.join(MODELS_DIR, file_name)
         
         if not os.path.exists(save_path):
             return False
+
+        if not self.deep_verify:
+            try:
+                with open(save_path, 'rb') as f:
+                    header = f.read(_MODEL_MAGIC_LENGTH)
+            except OSError as e:
+                print(f"Warning: Model file {file_name} cannot be read ({e}). Will retrain.")
+                return False
+            if not header.startswith(_MODEL_FILE_MAGICS):
+                print(f"Warning: Model file {file_name} is empty or not a saved model. Will retrain.")
+                return False
+            return True
         
-        # Verify the model can actually be loaded
+        # Verify the model can actually be loaded; the loaded copy is kept for reuse
         try:
-            joblib.load(save_path)
+            self._load_model_file(save_path)
             return True
         except Exception as e:
             print(f"Warning: Model file {file_name} exists but cannot be loaded ({e}). Will retrain.")
             return False
 
-    def _load_existing_model(self, model_class):
-        """Load an existing model from disk."""
-        model_name = model_class.__name__
-        file_name = f"{model_name}.joblib"
-        load_path = os.path.join(MODELS_DIR, file_name)
-        
+    def _load_model_file(self, path):
+        """Loads a saved model, deserializing each version of the file only once per pipeline."""
+        mtime = os.path.getmtime(path)
+        cached = self._loaded_models.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        model = joblib.load(path)
+        self._loaded_models[path] = (mtime, model)
+        return model
+
+    def _model_signature(self, model):
+        """
+        Describes what a saved model must match to be reused: its training data and setup,
+        and the feature and model code it was built with.
+        """
+        estimator = getattr(model, 'model', None)
+        return {
+            'train_hash': self.train_hash,
+            'sklearn_version': sklearn.__version__,
+            'params': repr(sorted(estimator.get_params().items())) if hasattr(estimator, 'get_params') else None,
+            # Editing the feature or model code must invalidate previously trained models
+            'code_version': [os.path.getmtime(path) for path in _MODEL_CODE_FILES],
+        }
+
+    def _load_trained_model(self, model):
+        """
+        Loads the saved copy of `model` if it was trained on exactly the current training
+        fights with the same setup, so the pipeline can skip training it. Returns None otherwise.
+        """
+        model_name = model.__class__.__name__
+        model_path = os.path.join(TRAINED_MODELS_CACHE_DIR, f"{model_name}.joblib")
+        meta_path = os.path.join(TRAINED_MODELS_CACHE_DIR, f"{model_name}.json")
+        if not os.path.exists(model_path) or not os.path.exists(meta_path):
+            return None
         try:
-            loaded_model = joblib.load(load_path)
-            print(f"Loaded existing model: {model_name}")
-            return loaded_model
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                saved_signature = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return None
+        if saved_signature != self._model_signature(model):
+            return None
+        try:
+            loaded_model = self._load_model_file(model_path)
         except Exception as e:
             print(f"Error loading model {model_name}: {e}")
             return None
+        print(f"Loaded existing model: {model_name}")
+        return loaded_model
+
+    def _save_trained_model(self, model):
+        """
+        Saves a model trained on the current training fights, with its signature alongside.
+        These go to the cache directory, not MODELS_DIR, which holds the models the app serves.
+        """
+        model_name = model.__class__.__name__
+        os.makedirs(TRAINED_MODELS_CACHE_DIR, exist_ok=True)
+        try:
+            _dump_model(model, os.path.join(TRAINED_MODELS_CACHE_DIR, f"{model_name}.joblib"))
+            with open(os.path.join(TRAINED_MODELS_CACHE_DIR, f"{model_name}.json"), 'w', encoding='utf-8') as f:
+                json.dump(self._model_signature(model), f, indent=4)
+        except Exception as e:
+            print(f"Warning: Could not save trained model {model_name}: {e}")
 
     def _should_retrain_models(self):
         """Determine if models should be retrained."""
@@ -142,14 +367,14 @@ class PredictionPipeline:
         missing_models = [m for m in self.models if not self._model_exists(m)]
         if missing_models:
             missing_names = [m.__class__.__name__ for m in missing_models]
-            print(f"Missing model files for: {missing_names}. Retraining all models.")
+            print(f"Missing model files for: {missing_names}. The best model will be retrained on the full dataset.")
             return True
         
         # Check if there's new data since last training
         if self._has_new_data_since_last_training():
             return True
         
-        print("No new data detected and all model files exist. Using existing models.")
+        print("No new data detected and all model files exist. Keeping the saved best model.")
         return False
 
     def _load_and_split_data(self, num_test_events: int = 1) -> None:
@@ -166,24 +391,61 @@ class PredictionPipeline:
             num_test_events = len(all_events)
             
         test_event_names = all_events[-num_test_events:]
-        self.train_fights = [f for f in fights if f['event_name'] not in test_event_names]
-        self.test_fights = [f for f in fights if f['event_name'] in test_event_names]
+        self.train_fights, self.test_fights = _partition_by_event(fights, set(test_event_names))
+        self.train_hash = fights_fingerprint(self.train_fights)
         print(f"Data loaded. {len(self.train_fights)} training fights, {len(self.test_fights)} testing fights.")
         print(f"Testing on the last {num_test_events} event(s): {', '.join(test_event_names)}")
 
     def _load_fights(self) -> list:
-        """Helper method to load and sort fights from CSV."""
-        with open(FIGHTS_CSV_PATH, 'r', encoding='utf-8') as f:
-            fights = list(csv.DictReader(f))
-        
-        fights.sort(key=lambda x: datetime.strptime(x['event_date'], '%B %d, %Y'))
-        return fights
+        """
+        Helper method to load and sort fights from CSV. The sorted list is reused until
+        the file changes, so callers must not modify it in place.
+        """
+        mtime = os.path.getmtime(FIGHTS_CSV_PATH)
+        if self._fights_cache is None or self._fights_cache[0] != mtime:
+            with open(FIGHTS_CSV_PATH, 'r', encoding='utf-8') as f:
+                fights = list(csv.DictReader(f))
+
+            # Every fight on a card repeats the same event name and date. Sharing one
+            # interned string per value saves memory, and its hash is computed only once
+            # for the many set and cache lookups on these keys.
+            for fight in fights:
+                fight['event_name'] = sys.intern(fight['event_name'])
+                fight['event_date'] = sys.intern(fight['event_date'])
+
+            fights.sort(key=lambda x: _parse_event_date(x['event_date']))
+            self._fights_cache = (mtime, fights)
+        return self._fights_cache[1]
+
+    def _train_models(self, indices, train_fights, n_jobs):
+        """
+        Trains the models at `indices` of self.models and puts the trained instances back in
+        place. With a single worker (the default) they are trained in this process, where
+        they share the training histories, fighter table and feature matrix. Larger *n_jobs*
+        trains them in parallel worker processes, each building its own copy of those.
+        """
+        if not indices:
+            return
+        n_workers = _n_workers(n_jobs, len(indices))
+        if n_workers == 1:
+            for i in indices:
+                self.models[i] = _train_model(self.models[i], train_fights)
+            return
+        trained = Parallel(n_jobs=n_workers, backend='loky')(
+            delayed(_train_model)(self.models[i], train_fights) for i in indices
+        )
+        for i, model in zip(indices, trained):
+            self.models[i] = model
 
-    def run(self, detailed_report: bool = True) -> None:
-        """Executes the full pipeline: load, train, evaluate, report and save models."""
+    def run(self, detailed_report: bool = True, n_jobs: int = 1) -> None:
+        """
+        Executes the full pipeline: load, train, evaluate, report and save models.
+        Models that need training are trained in this process by default, or in up to
+        *n_jobs* processes (-1 uses every core).
+        """
         self._load_and_split_data()
         
-        eval_fights = [f for f in self.test_fights if f['winner'] not in ["Draw", "NC", ""]]
+        eval_fights = _definitive_fights(self.test_fights)
         if not eval_fights:
             print("No fights with definitive outcomes in the test set. Aborting.")
             return
@@ -193,33 +455,39 @@ class PredictionPipeline:
         # Track best model across all evaluations
         best_model_info = {'accuracy': 0, 'model_name': '', 'model': None}
         
+        # A saved model trained on exactly these fights is reused instead of retrained;
+        # the others are trained side by side
+        model_statuses = []
+        to_train = []
         for i, model in enumerate(self.models):
+            loaded_model = None
+            if self.use_existing_models and not self.force_retrain:
+                loaded_model = self._load_trained_model(model)
+            if loaded_model is not None:
+                # Replace the model instance with the loaded one
+                self.models[i] = loaded_model
+                model_statuses.append("loaded from disk")
+            else:
+                to_train.append(i)
+                model_statuses.append("retrained")
+        self._train_models(to_train, self.train_fights, n_jobs)
+        for i in to_train:
+            self._save_trained_model(self.models[i])
+
+        for model, model_status in zip(self.models, model_statuses):
             model_name = model.__class__.__name__
             print(f"\n--- Evaluating Model: {model_name} ---")
             
-            if should_retrain:
-                print(f"Training {model_name}...")
-                model.train(self.train_fights)
-            else:
-                # Try to load existing model, fall back to training if loading fails
-                loaded_model = self._load_existing_model(model.__class__)
-                if loaded_model is not None:
-                    # Replace the model instance with the loaded one
-                    self.models[i] = loaded_model
-                    model = loaded_model
-                else:
-                    print(f"Failed to load {model_name}, training new model...")
-            model.train(self.train_fights)
-            
             correct_predictions = 0
             predictions = []
             
-            for fight in eval_fights:
+            # All evaluation fights are predicted in one batch
+            prediction_results = model.predict_many(eval_fights)
+            for fight, prediction_result in zip(eval_fights, prediction_results):
                 f1_name, f2_name = fight['fighter_1'], fight['fighter_2']
                 actual_winner = fight['winner']
                 event_name = fight.get('event_name', 'Unknown Event')
                 
-                prediction_result = model.predict(fight)
                 predicted_winner = prediction_result.get('winner')
                 probability = prediction_result.get('probability')
 
@@ -237,7 +505,6 @@ class PredictionPipeline:
                 })
                 
             accuracy = (correct_predictions / len(eval_fights)) * 100
-            model_status = "retrained" if should_retrain else "loaded from disk"
             self.results[model_name] = {
                 'accuracy': accuracy, 
                 'predictions': predictions,
@@ -269,9 +536,10 @@ class PredictionPipeline:
         if should_retrain:
             self._train_and_save_best_model(best_model_info)
 
-    def run_kfold_cv(self, k: int = 3, holdout_events: int = 1):
+    def run_kfold_cv(self, k: int = 3, holdout_events: int = 1, n_jobs: int = -1):
         """Performs k-fold cross-validation where each fold is a set of events.
-        Within each fold, we keep the last *holdout_events* for testing."""
+        Within each fold, we keep the last *holdout_events* for testing.
+        Folds run in up to *n_jobs* worker processes (-1 uses every core)."""
         fights = self._load_fights()
 
         # Build an ordered list of unique events
@@ -280,54 +548,47 @@ class PredictionPipeline:
         # Initialize KFold splitter on events
         kf = KFold(n_splits=k, shuffle=True, random_state=42)
 
+        # Positions of each event's fights, grouped once for all folds
+        fights_by_event = defaultdict(list)
+        for i, fight in enumerate(fights):
+            fights_by_event[fight['event_name']].append(i)
+
+        # Build every fold's train/test split up front, so only the split is sent to a worker
+        fold_splits = []
+        for fold_idx, (train_event_idx, test_event_idx) in enumerate(kf.split(event_list), start=1):
+            # event_list is in order of first appearance, so sorted indices give the fold's
+            # events in that order. Inside this fold, reserve the last `holdout_events` for testing.
+            fold_events = sorted(train_event_idx)
+            test_events = fold_events[-holdout_events:]
+            fit_events = fold_events[:len(fold_events) - len(test_events)]
+
+            # Gather the fights from the event buckets; sorting the positions keeps file order,
+            # which matters for events whose fights are interleaved
+            train_set = [fights[i] for i in sorted(i for e in fit_events for i in fights_by_event[event_list[e]])]
+            test_set = [fights[i] for i in sorted(i for e in test_events for i in fights_by_event[event_list[e]])]
+            # Scored like run(): draws and no contests are left out, once per fold
+            test_set = _definitive_fights(test_set)
+            fold_splits.append((fold_idx, len(train_event_idx), train_set, test_set))
+
+        # Folds are independent, so they are trained and scored in separate processes.
+        # The fold experiment is created (or looked up) once here, before any worker starts.
+        experiment_id = mlflow.set_experiment("UFC_KFold_CV").experiment_id
+        fold_outputs = Parallel(n_jobs=_n_workers(n_jobs, len(fold_splits)), backend='loky')(
+            delayed(_run_fold)(self.models, experiment_id, fold_idx, n_train_events, holdout_events, train_set, test_set)
+            for fold_idx, n_train_events, train_set, test_set in fold_splits
+        )
+
         # Track best model across all folds
         best_model_info = {'accuracy': 0, 'model_name': '', 'model': None}
-        
         all_fold_metrics = []
-        for fold_idx, (train_event_idx, test_event_idx) in enumerate(kf.split(event_list), start=1):
-            train_events = [event_list[i] for i in train_event_idx]
-
-            # Collect fights that belong to the training events
-            fold_fights = [f for f in fights if f['event_name'] in train_events]
-
-            # Inside this fold, reserve the last `holdout_events` events for testing
-            fold_events_ordered = list(OrderedDict.fromkeys(f['event_name'] for f in fold_fights))
-            test_events = fold_events_ordered[-holdout_events:]
-
-            train_set = [f for f in fold_fights if f['event_name'] not in test_events]
-            test_set  = [f for f in fold_fights if f['event_name'] in test_events]
-
-            # Start an MLflow run for the current fold
-            mlflow.set_experiment("UFC_KFold_CV")
-            with mlflow.start_run(run_name=f"fold_{fold_idx}"):
-                # Log meta information about the fold
-                mlflow.log_param("fold", fold_idx)
-                mlflow.log_param("train_events", len(train_events))
-                mlflow.log_param("test_events", holdout_events)
-
-                fold_results = {}
-                for model in self.models:
-                    model_name = model.__class__.__name__
-
-                    # Train and evaluate
-                    model.train(train_set)
-                    correct = 0
-                    for fight in test_set:
-                        prediction = model.predict(fight)
-                        if prediction.get('winner') == fight['winner']:
-                            correct += 1
-
-                    acc = correct / len(test_set) if test_set else 0.0
-                    fold_results[model_name] = acc
-                    mlflow.log_metric(f"accuracy_{model_name}", acc)
-
-                    # Update best model tracking
-                    if acc > best_model_info['accuracy']:
-                        best_model_info['accuracy'] = acc
-                        best_model_info['model_name'] = model_name
-                        best_model_info['model'] = model
-
-                all_fold_metrics.append(fold_results)
+        for fold_results, fold_models in fold_outputs:
+            all_fold_metrics.append(fold_results)
+            for model_name, acc in fold_results.items():
+                # Update best model tracking
+                if acc > best_model_info['accuracy']:
+                    best_model_info['accuracy'] = acc
+                    best_model_info['model_name'] = model_name
+                    best_model_info['model'] = fold_models[model_name]
 
         # Log the overall best model across all folds
         if best_model_info['model'] is not None:
@@ -341,10 +602,11 @@ class PredictionPipeline:
 
         return all_fold_metrics, best_model_info
 
-    def update_models_if_new_data(self):
+    def update_models_if_new_data(self, n_jobs: int = 1):
         """
         Checks for new data and retrains/saves the best model on the full dataset if needed.
-        This runs a quick evaluation to determine the best model.
+        This runs a quick evaluation to determine the best model, training the candidates
+        in this process by default, or in up to *n_jobs* processes.
         """
         print("\n--- Checking for Model Updates ---")
         
@@ -357,20 +619,16 @@ class PredictionPipeline:
             
             # Quick evaluation to find best model
             self._load_and_split_data()
-            eval_fights = [f for f in self.test_fights if f['winner'] not in ["Draw", "NC", ""]]
+            eval_fights = _definitive_fights(self.test_fights)
             
             best_model_info = {'accuracy': 0, 'model_name': '', 'model': None}
+            self._train_models(list(range(len(self.models))), self.train_fights, n_jobs)
             
             for model in self.models:
                 model_name = model.__class__.__name__
                 print(f"Evaluating {model_name}...")
                 
-                model.train(self.train_fights)
-                correct = 0
-                for fight in eval_fights:
-                    prediction = model.predict(fight)
-                    if prediction.get('winner') == fight['winner']:
-                        correct += 1
+                correct = _count_correct(eval_fights, model.predict_many(eval_fights))
                 
                 accuracy = (correct / len(eval_fights)) * 100 if eval_fights else 0
                 
@@ -392,8 +650,9 @@ class PredictionPipeline:
             print(f"Error: Fights data not found at '{FIGHTS_CSV_PATH}'. Cannot save model.")
             return
             
-        with open(FIGHTS_CSV_PATH, 'r', encoding='utf-8') as f:
-            all_fights = list(csv.DictReader(f))
+        all_fights = self._load_fights()
+        # Version of the CSV these fights were read from, recorded with the last event
+        fights_mtime = self._fights_cache[0]
         
         print(f"Training best model on all {len(all_fights)} available fights...")
 
@@ -403,7 +662,6 @@ class PredictionPipeline:
 
         # Get the latest event info for tracking
         if all_fights:
-            all_fights.sort(key=lambda x: datetime.strptime(x['event_date'], '%B %d, %Y'))
             latest_fight = all_fights[-1]
             latest_event_name = latest_fight['event_name']
             latest_event_date = latest_fight['event_date']
@@ -418,12 +676,12 @@ class PredictionPipeline:
             # Sanitize and save the best model
             file_name = f"best_{model_name}_{best_model_info['accuracy']:.2f}%.joblib"
             save_path = os.path.join(MODELS_DIR, file_name)
-            joblib.dump(model, save_path)
+            _dump_model(model, save_path)
             print(f"Best model saved successfully to {save_path} with {best_model_info['accuracy']:.2f}% accuracy")
 
             # Save the last trained event info
             if all_fights:
-                self._save_last_trained_event(latest_event_name, latest_event_date)
+                self._save_last_trained_event(latest_event_name, latest_event_date, fights_mtime)
                 print(f"Updated last trained event: {latest_event_name} ({latest_event_date})")
         else:
             print("No best model found to train and save.")
@@ -441,31 +699,40 @@ class PredictionPipeline:
     def _save_report_to_json(self, file_path=MODEL_RESULTS_PATH):
         """Saves the detailed prediction results to a JSON file."""
         print(f"\nSaving detailed report to {file_path}...")
+        # The report is written one model at a time, so only one model's regrouped
+        # predictions are held in memory next to self.results. It goes to a temporary
+        # file first, so a failed save never leaves a truncated report behind.
+        tmp_path = f"{file_path}.tmp"
         try:
-            # Create a report structure that is clean and JSON-friendly
-            report = {}
-            for model_name, result in self.results.items():
-                
-                # Group predictions by event for a more organized report
-                predictions_by_event = {}
-                for p in result['predictions']:
-                    event_name = p.pop('event') # Extract event and remove it from the sub-dictionary
-                    if event_name not in predictions_by_event:
-                        predictions_by_event[event_name] = []
-                    predictions_by_event[event_name].append(p)
-
-                report[model_name] = {
-                    "overall_accuracy": f"{result['accuracy']:.2f}%",
-                    "total_fights_evaluated": result['total_fights'],
-                    "model_status": result.get('model_status', 'unknown'),
-                    "predictions_by_event": predictions_by_event
-                }
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=4)
+            with open(tmp_path, 'wb') as f:
+                f.write(b'{')
+                for i, (model_name, result) in enumerate(self.results.items()):
+                    # Group predictions by event for a more organized report. The stored
+                    # predictions are left intact, so the report can be saved more than once.
+                    predictions_by_event = defaultdict(list)
+                    for p in result['predictions']:
+                        predictions_by_event[p.get('event')].append({k: v for k, v in p.items() if k != 'event'})
+
+                    model_report = {
+                        "overall_accuracy": f"{result['accuracy']:.2f}%",
+                        "total_fights_evaluated": result['total_fights'],
+                        "model_status": result.get('model_status', 'unknown'),
+                        "predictions_by_event": predictions_by_event
+                    }
+                    # orjson serializes straight to UTF-8 bytes. Each entry is nested one level
+                    # deep, so its lines are indented once more; JSON strings hold no raw newlines.
+                    entry = orjson.dumps(model_report, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
+                    f.write(b',\n  ' if i else b'\n  ')
+                    f.write(orjson.dumps(model_name) + b': ' + entry)
+                f.write(b'\n}' if self.results else b'}')
+            os.replace(tmp_path, file_path)
             print("Report saved successfully.")
         except (IOError, TypeError) as e:
             print(f"Error saving report to JSON file: {e}")
+        finally:
+            # Only left over if the save failed before the replace
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _report_detailed_results(self):
         """Prints a summary and saves the detailed report to a file."""
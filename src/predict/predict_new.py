@@ -1,10 +1,6 @@
-import argparse
 import os
-import joblib
 from datetime import datetime
 
-from ..config import MODELS_DIR
-
 def predict_new_fight(fighter1_name, fighter2_name, model_path):
     """
     Loads a trained model and predicts the outcome of a new, hypothetical fight.
@@ -16,7 +12,11 @@ def predict_new_fight(fighter1_name, fighter2_name, model_path):
         raise FileNotFoundError(f"Model file not found at '{model_path}'. Please train and save a model first.")
     
     print(f"Loading model from {model_path}...")
-    model = joblib.load(model_path)
+    # joblib comes in with the loader, so importing this module stays cheap
+    from .model_loader import get_model
+    # Shared, memory-mapped model cache: predicting several fights in one process
+    # loads each model file only once. An absolute path is used as-is under MODELS_DIR.
+    model = get_model(os.path.abspath(model_path))
     print(f"Model '{model.model.__class__.__name__}' loaded.")
 
     # 2. Create the fight dictionary for prediction
@@ -1,29 +1,85 @@
+import numpy as np
 import pandas as pd
 import os
+from collections import OrderedDict, defaultdict
+from typing import Optional
 from datetime import datetime
+from ..io_cache import memory
+from . import utils
 from .utils import (
     parse_round_time_to_seconds, parse_striking_stats, to_int_safe, 
-    calculate_age, prepare_fighters_data
+    load_prepared_fighters, fights_fingerprint
 )
-from .config import DEFAULT_ELO, N_FIGHTS_HISTORY
+from .config import DEFAULT_ELO, N_FIGHTS_HISTORY, DATE_FORMAT_EVENT, DATE_FORMAT_DOB
 
+# Preprocessed matrices of the most recent training sets, shared by every model
+# trained on the same split in this process
+_PREPROCESS_MEMO = OrderedDict()
+_PREPROCESS_MEMO_SIZE = 4
 
+# Per-fight quantities summed over the last-n window, in column order of the prefix sums
+_HISTORY_SUM_FIELDS = (
+    'wins', 'ko_wins', 'opp_elo_sum', 'opp_elo_count', 'time_secs',
+    'sig_str_landed', 'td_landed', 'td_attempted', 'sub_attempts',
+)
+
+def _build_history_arrays(
+    fighter_name: str,
+    fighter_history: list[dict[str, any]],
+    elo_by_name: dict[str, float]
+) -> dict[str, np.ndarray]:
+    """
+    Converts a date-sorted fight history into columnar arrays seen from the fighter's
+    side: the fight dates, and prefix sums of every _HISTORY_SUM_FIELDS quantity.
+    Striking and time stats are parsed once here, so the stats of any window of
+    fights are a single row subtraction.
+    """
+    size = len(fighter_history)
+    dates = np.empty(size, dtype='datetime64[ns]')
+    # One row per fight; counts are small integers, exact in float64
+    values = np.zeros((size, len(_HISTORY_SUM_FIELDS)), dtype=np.float64)
+    for i, fight in enumerate(fighter_history):
+        is_fighter_1 = (fight['fighter_1'] == fighter_name)
+        opponent_name = fight['fighter_2'] if is_fighter_1 else fight['fighter_1']
+        f_prefix = 'f1' if is_fighter_1 else 'f2'
+
+        dates[i] = pd.Timestamp(fight['date_obj']).to_datetime64()
+        won = fight['winner'] == fighter_name
+        ko_win = won and 'KO' in fight['method']
+
+        # Opponents without an ELO entry are left out of the average
+        opp_elo, opp_count = 0, 0
+        if opponent_name in elo_by_name:
+            opp_elo = elo_by_name[opponent_name]
+            opp_elo = opp_elo if pd.notna(opp_elo) else DEFAULT_ELO
+            opp_count = 1
+
+        sig_str_landed, _ = parse_striking_stats(fight.get(f'{f_prefix}_sig_str', '0 of 0'))
+        td_landed, td_attempted = parse_striking_stats(fight.get(f'{f_prefix}_td', '0 of 0'))
+        values[i] = (
+            won, ko_win, opp_elo, opp_count,
+            parse_round_time_to_seconds(fight['round'], fight['time']),
+            sig_str_landed, td_landed, td_attempted,
+            to_int_safe(fight.get(f'{f_prefix}_sub_att')),
+        )
 
-def _get_fighter_history_stats(
-    fighter_name: str, 
-    current_fight_date: datetime, 
-    fighter_history: list[dict[str, any]], 
-    fighters_df: pd.DataFrame, 
+    # A leading zero row makes the sums over fights [i, j) equal to prefix[j] - prefix[i]
+    prefix_sums = np.zeros((size + 1, len(_HISTORY_SUM_FIELDS)), dtype=np.float64)
+    np.cumsum(values, axis=0, out=prefix_sums[1:])
+    return {'date': dates, 'prefix_sums': prefix_sums}
+
+def _get_history_stats_from_arrays(
+    history: dict[str, np.ndarray],
+    current_fight_date: datetime,
     n: int = N_FIGHTS_HISTORY
 ) -> dict[str, float]:
     """
-    Calculates performance statistics for a fighter based on their last n fights.
+    Calculates performance statistics for a fighter based on their last n fights before
+    the current date, from the arrays built by _build_history_arrays. The fights before
+    the current date are found by binary search.
     """
-    past_fights = [f for f in fighter_history if f['date_obj'] < current_fight_date]
-    last_n_fights = past_fights[-n:]
-
-    if not last_n_fights:
-        # Return a default dictionary with the correct keys for a fighter with no history
+    end = int(np.searchsorted(history['date'], pd.Timestamp(current_fight_date).to_datetime64(), side='left'))
+    if end == 0:
         return {
             'wins_last_n': 0,
             'avg_opp_elo_last_n': DEFAULT_ELO,
@@ -32,54 +88,56 @@ def _get_fighter_history_stats(
             'takedown_accuracy_last_n': 0,
             'sub_attempts_per_min_last_n': 0,
         }
+    prefix_sums = history['prefix_sums']
+    (wins, ko_wins, opp_elo_sum, opp_elo_count, total_time_secs,
+     sig_str_landed, td_landed, td_attempted, sub_attempts) = (
+        prefix_sums[end] - prefix_sums[max(0, end - n)]
+    ).tolist()
 
-    stats = {
-        'wins': 0, 'ko_wins': 0, 'total_time_secs': 0,
-        'sig_str_landed': 0, 'opponent_elos': [],
-        'td_landed': 0, 'td_attempted': 0, 'sub_attempts': 0
-    }
+    wins = int(wins)
+    avg_opp_elo = opp_elo_sum / opp_elo_count if opp_elo_count else 1500
+    total_minutes = total_time_secs / 60 if total_time_secs > 0 else 0
 
-    for fight in last_n_fights:
-        is_fighter_1 = (fight['fighter_1'] == fighter_name)
-        opponent_name = fight['fighter_2'] if is_fighter_1 else fight['fighter_1']
-        
-        f_prefix = 'f1' if is_fighter_1 else 'f2'
-
-        if fight['winner'] == fighter_name:
-            stats['wins'] += 1
-            if 'KO' in fight['method']:
-                stats['ko_wins'] += 1
-
-        if opponent_name in fighters_df.index:
-            opp_elo = fighters_df.loc[opponent_name, 'elo']
-            stats['opponent_elos'].append(opp_elo if pd.notna(opp_elo) else DEFAULT_ELO)
-        
-        stats['total_time_secs'] += parse_round_time_to_seconds(fight['round'], fight['time'])
-        
-        sig_str_stat = fight.get(f'{f_prefix}_sig_str', '0 of 0')
-        landed, _ = parse_striking_stats(sig_str_stat)
-        stats['sig_str_landed'] += landed
-
-        td_stat = fight.get(f'{f_prefix}_td', '0 of 0')
-        td_landed, td_attempted = parse_striking_stats(td_stat)
-        stats['td_landed'] += td_landed
-        stats['td_attempted'] += td_attempted
-        
-        stats['sub_attempts'] += to_int_safe(fight.get(f'{f_prefix}_sub_att'))
-
-    # Final calculations
-    avg_opp_elo = sum(stats['opponent_elos']) / len(stats['opponent_elos']) if stats['opponent_elos'] else 1500
-    total_minutes = stats['total_time_secs'] / 60 if stats['total_time_secs'] > 0 else 0
-    
     return {
-        'wins_last_n': stats['wins'],
+        'wins_last_n': wins,
         'avg_opp_elo_last_n': avg_opp_elo,
-        'ko_percent_last_n': (stats['ko_wins'] / stats['wins']) if stats['wins'] > 0 else 0,
-        'sig_str_landed_per_min_last_n': (stats['sig_str_landed'] / total_minutes) if total_minutes > 0 else 0,
-        'takedown_accuracy_last_n': (stats['td_landed'] / stats['td_attempted']) if stats['td_attempted'] > 0 else 0,
-        'sub_attempts_per_min_last_n': (stats['sub_attempts'] / total_minutes) if total_minutes > 0 else 0,
+        'ko_percent_last_n': (ko_wins / wins) if wins > 0 else 0,
+        'sig_str_landed_per_min_last_n': (sig_str_landed / total_minutes) if total_minutes > 0 else 0,
+        'takedown_accuracy_last_n': (td_landed / td_attempted) if td_attempted > 0 else 0,
+        'sub_attempts_per_min_last_n': (sub_attempts / total_minutes) if total_minutes > 0 else 0,
     }
 
+# Column order of the feature matrix built by preprocess_for_ml
+FEATURE_COLUMNS = (
+    'elo_diff', 'height_diff_cm', 'reach_diff_in', 'age_diff_years', 'stance_is_different',
+    'wins_last_5_diff', 'avg_opp_elo_last_5_diff', 'ko_percent_last_5_diff',
+    'sig_str_landed_per_min_last_5_diff', 'takedown_accuracy_last_5_diff',
+    'sub_attempts_per_min_last_5_diff',
+)
+# Per-fighter values whose fighter_1 - fighter_2 differences fill the _DIFF_COLUMNS
+# of the feature matrix; the age difference and the stance flag are set separately
+_FIGHTER_FEATURES = (
+    'elo', 'height_cm', 'reach_in', 'wins_last_n', 'avg_opp_elo_last_n', 'ko_percent_last_n',
+    'sig_str_landed_per_min_last_n', 'takedown_accuracy_last_n', 'sub_attempts_per_min_last_n',
+)
+_DIFF_COLUMNS = [0, 1, 2, 5, 6, 7, 8, 9, 10]
+_AGE_COLUMN = 3
+_STANCE_COLUMN = 4
+
+def _fighter_feature_values(
+    fighter_stats: dict[str, any],
+    history: dict[str, np.ndarray],
+    fight_date: datetime
+) -> tuple:
+    """A fighter's _FIGHTER_FEATURES values going into a fight, in order."""
+    hist_stats = _get_history_stats_from_arrays(history, fight_date)
+    return (
+        fighter_stats.get('elo', 1500), fighter_stats.get('height_cm', 0), fighter_stats.get('reach_in', 0),
+        hist_stats['wins_last_n'], hist_stats['avg_opp_elo_last_n'], hist_stats['ko_percent_last_n'],
+        hist_stats['sig_str_landed_per_min_last_n'], hist_stats['takedown_accuracy_last_n'],
+        hist_stats['sub_attempts_per_min_last_n'],
+    )
+
 def preprocess_for_ml(
     fights_to_process: list[dict[str, any]], 
     fighters_csv_path: str
@@ -98,92 +156,137 @@ def preprocess_for_ml(
     if not os.path.exists(fighters_csv_path):
         raise FileNotFoundError(f"Fighters data not found at '{fighters_csv_path}'.")
 
-    fighters_df = pd.read_csv(fighters_csv_path)
-    fighters_prepared = prepare_fighters_data(fighters_df)
+    fighters_prepared = load_prepared_fighters(fighters_csv_path)
+    # Plain dict records make the per-fight lookups below cheap hash lookups
+    fighter_records = fighters_prepared.to_dict('index')
 
     # 2. Pre-calculate fighter histories to speed up lookups
-    # And convert date strings to datetime objects once
-    for fight in fights_to_process:
-        try:
-            # This will work if event_date is a string
-            fight['date_obj'] = datetime.strptime(fight['event_date'], '%B %d, %Y')
-        except TypeError:
-            # This will be triggered if it's already a date-like object (e.g., Timestamp)
-            fight['date_obj'] = fight['event_date']
+    # And convert date strings to datetime objects once, in one vectorized parse
+    # (already parsed Timestamps pass through unchanged)
+    event_dates = pd.to_datetime(
+        [fight['event_date'] for fight in fights_to_process], format=DATE_FORMAT_EVENT, cache=True
+    )
+    for fight, date_obj in zip(fights_to_process, event_dates):
+        fight['date_obj'] = date_obj
+
+    # Age difference of every fight, from fighter birth dates parsed once. Fights with
+    # a missing birth date (or an age of zero) get no age difference, as before.
+    dob_by_name = pd.to_datetime(fighters_prepared['dob'], format=DATE_FORMAT_DOB, errors='coerce')
+    f1_dob = dob_by_name.reindex([fight['fighter_1'] for fight in fights_to_process]).to_numpy()
+    f2_dob = dob_by_name.reindex([fight['fighter_2'] for fight in fights_to_process]).to_numpy()
+    f1_ages = (event_dates.to_numpy() - f1_dob) / np.timedelta64(1, 'D') / 365.25
+    f2_ages = (event_dates.to_numpy() - f2_dob) / np.timedelta64(1, 'D') / 365.25
+    has_ages = ~np.isnan(f1_ages) & ~np.isnan(f2_ages) & (f1_ages != 0) & (f2_ages != 0)
+    age_diffs = [
+        diff if has_age else 0
+        for diff, has_age in zip((f1_ages - f2_ages).tolist(), has_ages.tolist())
+    ]
     
-    fighter_histories = {}
-    for fighter_name in fighters_prepared.index:
-        history = [f for f in fights_to_process if fighter_name in (f['fighter_1'], f['fighter_2'])]
-        fighter_histories[fighter_name] = sorted(history, key=lambda x: x['date_obj'])
+    # Index the fights by fighter once instead of scanning every fight for every fighter.
+    # Walking the fights in date order leaves every fighter's list already date-sorted.
+    fight_index = defaultdict(list)
+    for fight in sorted(fights_to_process, key=lambda x: x['date_obj']):
+        fight_index[fight['fighter_1']].append(fight)
+        if fight['fighter_2'] != fight['fighter_1']:
+            fight_index[fight['fighter_2']].append(fight)
+
+    # Each history is reduced once to prefix-sum arrays, so the last-n stats of every
+    # fight are a binary search and a row subtraction instead of a rescan of the history
+    elo_by_name = fighters_prepared['elo'].to_dict()
+    history_arrays = {}
+    for fighter_name, history in fight_index.items():
+        if fighter_name in fighter_records:
+            history_arrays[fighter_name] = _build_history_arrays(fighter_name, history, elo_by_name)
 
     # 3. Process fights to create features and targets
-    feature_list = []
-    target_list = []
-    metadata_list = []
+    # The per-fighter values are gathered into arrays, one row per fight, so the
+    # feature differences of all fights are taken at once
+    kept_fights = []
+    f1_values, f2_values, stance_flags = [], [], []
 
-    for fight in fights_to_process:
+    for i, fight in enumerate(fights_to_process):
         # Per the dataset's design, fighter_1 is always the winner.
         f1_name, f2_name = fight['fighter_1'], fight['fighter_2']
 
-        if f1_name not in fighters_prepared.index or f2_name not in fighters_prepared.index:
+        f1_stats, f2_stats = fighter_records.get(f1_name), fighter_records.get(f2_name)
+        if f1_stats is None or f2_stats is None:
             continue
 
-        f1_stats, f2_stats = fighters_prepared.loc[f1_name], fighters_prepared.loc[f2_name]
-        
-        if isinstance(f1_stats, pd.DataFrame): f1_stats = f1_stats.iloc[0]
-        if isinstance(f2_stats, pd.DataFrame): f2_stats = f2_stats.iloc[0]
-
-        # Calculate ages for both fighters
-        f1_age = calculate_age(f1_stats.get('dob'), fight['event_date'])
-        f2_age = calculate_age(f2_stats.get('dob'), fight['event_date'])
-
-        # Get historical stats for both fighters
-        f1_hist_stats = _get_fighter_history_stats(f1_name, fight['date_obj'], fighter_histories.get(f1_name, []), fighters_prepared)
-        f2_hist_stats = _get_fighter_history_stats(f2_name, fight['date_obj'], fighter_histories.get(f2_name, []), fighters_prepared)
-        
-        # --- Create two training examples from each fight for a balanced dataset ---
-
-        # 1. The "Win" case: (fighter_1 - fighter_2)
-        features_win = {
-            # Original diffs
-            'elo_diff': f1_stats.get('elo', 1500) - f2_stats.get('elo', 1500),
-            'height_diff_cm': f1_stats.get('height_cm', 0) - f2_stats.get('height_cm', 0),
-            'reach_diff_in': f1_stats.get('reach_in', 0) - f2_stats.get('reach_in', 0),
-            'age_diff_years': (f1_age - f2_age) if f1_age and f2_age else 0,
-            'stance_is_different': 1 if f1_stats.get('stance') != f2_stats.get('stance') else 0,
-            # New historical diffs
-            'wins_last_5_diff': f1_hist_stats['wins_last_n'] - f2_hist_stats['wins_last_n'],
-            'avg_opp_elo_last_5_diff': f1_hist_stats['avg_opp_elo_last_n'] - f2_hist_stats['avg_opp_elo_last_n'],
-            'ko_percent_last_5_diff': f1_hist_stats['ko_percent_last_n'] - f2_hist_stats['ko_percent_last_n'],
-            'sig_str_landed_per_min_last_5_diff': f1_hist_stats['sig_str_landed_per_min_last_n'] - f2_hist_stats['sig_str_landed_per_min_last_n'],
-            # Grappling features
-            'takedown_accuracy_last_5_diff': f1_hist_stats['takedown_accuracy_last_n'] - f2_hist_stats['takedown_accuracy_last_n'],
-            'sub_attempts_per_min_last_5_diff': f1_hist_stats['sub_attempts_per_min_last_n'] - f2_hist_stats['sub_attempts_per_min_last_n'],
-        }
-        feature_list.append(features_win)
-        target_list.append(1)  # 1 represents a win
-
-        # 2. The "Loss" case: (fighter_2 - fighter_1)
-        # We invert the differences for the losing case.
-        features_loss = {key: -value for key, value in features_win.items()}
-        # Stance difference is symmetric; it doesn't get inverted.
-        features_loss['stance_is_different'] = features_win['stance_is_different']
-        
-        feature_list.append(features_loss)
-        target_list.append(0)  # 0 represents a loss
-
-        # Add metadata for both generated samples
-        # The 'winner' and 'loser' are consistent with the original data structure
-        metadata_list.append({
-            'winner': f1_name, 'loser': f2_name, 'event_date': fight['event_date']
-        })
-        metadata_list.append({
-            'winner': f1_name, 'loser': f2_name, 'event_date': fight['event_date']
-        })
-
-    X = pd.DataFrame(feature_list).fillna(0)
-    y = pd.Series(target_list, name='winner')
-    metadata = pd.DataFrame(metadata_list)
+        kept_fights.append(i)
+        f1_values.append(_fighter_feature_values(f1_stats, history_arrays[f1_name], fight['date_obj']))
+        f2_values.append(_fighter_feature_values(f2_stats, history_arrays[f2_name], fight['date_obj']))
+        stance_flags.append(1 if f1_stats.get('stance') != f2_stats.get('stance') else 0)
+
+    n_fights = len(kept_fights)
+    diffs = (
+        np.array(f1_values, dtype=np.float64).reshape(n_fights, len(_FIGHTER_FEATURES))
+        - np.array(f2_values, dtype=np.float64).reshape(n_fights, len(_FIGHTER_FEATURES))
+    )
+
+    # --- Create two training examples from each fight for a balanced dataset ---
+    # 1. The "Win" case: (fighter_1 - fighter_2)
+    features_win = np.empty((n_fights, len(FEATURE_COLUMNS)), dtype=np.float64)
+    features_win[:, _DIFF_COLUMNS] = diffs
+    features_win[:, _AGE_COLUMN] = np.array(age_diffs, dtype=np.float64)[kept_fights]
+    features_win[:, _STANCE_COLUMN] = stance_flags
+
+    # 2. The "Loss" case: (fighter_2 - fighter_1), interleaved after each win case.
+    # We invert the differences for the losing case.
+    feature_values = np.empty((2 * n_fights, len(FEATURE_COLUMNS)), dtype=np.float64)
+    feature_values[0::2] = features_win
+    feature_values[1::2] = -features_win
+    # Stance difference is symmetric; it doesn't get inverted.
+    feature_values[1::2, _STANCE_COLUMN] = features_win[:, _STANCE_COLUMN]
+    feature_values[np.isnan(feature_values)] = 0
+
+    X = pd.DataFrame(feature_values, columns=list(FEATURE_COLUMNS))
+    # 1 represents a win and 0 a loss. Binary labels fit in one byte, an eighth of
+    # the default int64 in memory and in the caches
+    y = pd.Series(np.tile(np.array([1, 0], dtype=np.int8), n_fights), name='winner')
+
+    # Metadata for both generated samples of each fight
+    # The 'winner' and 'loser' are consistent with the original data structure
+    kept = [fights_to_process[i] for i in kept_fights]
+    metadata = pd.DataFrame({
+        'winner': np.repeat(np.array([f['fighter_1'] for f in kept], dtype=object), 2),
+        'loser': np.repeat(np.array([f['fighter_2'] for f in kept], dtype=object), 2),
+        'event_date': np.repeat(np.array([f['event_date'] for f in kept], dtype=object), 2),
+    })
 
     print(f"Preprocessing complete. Generated {X.shape[0]} samples with {X.shape[1]} features.")
     return X, y, metadata
+
+@memory.cache(ignore=['fights_to_process'])
+def _preprocess_for_ml_cached(fingerprint, code_version, fights_to_process, fighters_csv_path):
+    """
+    Disk-cached preprocess_for_ml. The fights are identified by their fingerprint and
+    the feature code by code_version, so the fights list itself is not hashed.
+    """
+    return preprocess_for_ml(fights_to_process, fighters_csv_path)
+
+def preprocess_for_ml_cached(
+    fights_to_process: list[dict[str, any]],
+    fighters_csv_path: str,
+    fingerprint: Optional[str] = None
+) -> tuple[pd.DataFrame, pd.Series, pd.DataFrame]:
+    """
+    Same as preprocess_for_ml, but reuses the result of an earlier run on the same
+    fights and fighters file, first from memory and then from the disk cache.
+    Unlike preprocess_for_ml, it does not add 'date_obj' to the fights on a cache hit.
+    The returned objects are shared between callers and must not be modified in place.
+    """
+    if fingerprint is None:
+        fingerprint = fights_fingerprint(fights_to_process, fighters_csv_path)
+    # Editing the feature code must invalidate previously cached matrices
+    code_version = (os.path.getmtime(__file__), os.path.getmtime(utils.__file__))
+
+    key = (fingerprint, code_version, fighters_csv_path)
+    result = _PREPROCESS_MEMO.get(key)
+    if result is None:
+        result = _preprocess_for_ml_cached(fingerprint, code_version, fights_to_process, fighters_csv_path)
+        _PREPROCESS_MEMO[key] = result
+        while len(_PREPROCESS_MEMO) > _PREPROCESS_MEMO_SIZE:
+            _PREPROCESS_MEMO.popitem(last=False)
+    else:
+        _PREPROCESS_MEMO.move_to_end(key)
+    return result
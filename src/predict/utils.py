@@ -1,25 +1,50 @@
+import os
+import re
+import hashlib
 import pandas as pd
 from datetime import datetime
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Optional, Union, Any
 
+from ..config import FIGHTERS_CSV_PATH
+from ..io_cache import load_fighters, memory
 from .config import DEFAULT_ROUNDS_DURATION
 
+# Everything except digits and the decimal point, stripped from numeric text columns
+_NON_NUMERIC_CHARS = re.compile(r'[^0-9.]')
+
 def clean_numeric_column(series: pd.Series) -> pd.Series:
     """A helper to clean string columns into numbers, handling errors."""
+    # Columns the CSV reader already parsed as numbers need no text clean-up
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_numeric(series, errors='coerce')
     series_str = series.astype(str)
-    return pd.to_numeric(series_str.str.replace(r'[^0-9.]', '', regex=True), errors='coerce')
+    return pd.to_numeric(series_str.str.replace(_NON_NUMERIC_CHARS, '', regex=True), errors='coerce')
+
+@lru_cache(maxsize=8192)
+def _parse_date_cached(date_str: str, date_format: str) -> datetime:
+    return datetime.strptime(date_str, date_format)
 
-def calculate_age(dob_str: str, fight_date_str: str) -> Optional[float]:
-    """Calculates age in years from a date of birth string and fight date string."""
+def calculate_age(dob_str: str, fight_date_str: Union[str, datetime]) -> Optional[float]:
+    """
+    Calculates age in years from a date of birth string and fight date. The fight date
+    may be a string or an already parsed datetime/Timestamp, which skips re-parsing.
+    """
     if pd.isna(dob_str) or not dob_str:
         return None
     try:
-        dob = datetime.strptime(dob_str, '%b %d, %Y')
-        fight_date = datetime.strptime(fight_date_str, '%B %d, %Y')
+        dob = _parse_date_cached(dob_str, '%b %d, %Y')
+        if isinstance(fight_date_str, datetime):
+            fight_date = fight_date_str
+        else:
+            fight_date = _parse_date_cached(fight_date_str, '%B %d, %Y')
         return (fight_date - dob).days / 365.25
     except (ValueError, TypeError):
         return None
 
+# The round/time and striking strings take a few thousand distinct values across all
+# fights, while every fight is parsed again for each fighter's history
+@lru_cache(maxsize=8192)
 def parse_round_time_to_seconds(round_str: str, time_str: str) -> int:
     """Converts fight duration from round and time to total seconds."""
     try:
@@ -30,6 +55,7 @@ def parse_round_time_to_seconds(round_str: str, time_str: str) -> int:
     except (ValueError, TypeError, AttributeError):
         return 0
 
+@lru_cache(maxsize=8192)
 def parse_striking_stats(stat_str: str) -> tuple[int, int]:
     """Parses striking stats string like '10 of 20' into (landed, attempted)."""
     try:
@@ -40,6 +66,12 @@ def parse_striking_stats(stat_str: str) -> tuple[int, int]:
 
 def to_int_safe(val: Any) -> int:
     """Safely converts a value to an integer, returning 0 if it's invalid or empty."""
+    # Values read from the fights CSV are always strings, which need no missing-value check
+    if isinstance(val, str):
+        try:
+            return int(val.strip() or 0)
+        except ValueError:
+            return 0
     if pd.isna(val):
         return 0
     try:
@@ -50,15 +82,50 @@ def to_int_safe(val: Any) -> int:
 
 def prepare_fighters_data(fighters_df: pd.DataFrame) -> pd.DataFrame:
     """Prepares fighter data for analysis by cleaning and standardizing."""
-    fighters_prepared = fighters_df.copy()
-    fighters_prepared['full_name'] = fighters_prepared['first_name'] + ' ' + fighters_prepared['last_name']
-    
-    # Handle duplicate fighter names by keeping the first entry
-    fighters_prepared = fighters_prepared.drop_duplicates(subset=['full_name'], keep='first')
-    fighters_prepared = fighters_prepared.set_index('full_name')
+    full_name = (fighters_df['first_name'] + ' ' + fighters_df['last_name']).rename('full_name')
+
+    # Handle duplicate fighter names by keeping the first entry. Taking the kept rows
+    # is the only copy made, so the caller's DataFrame is never modified.
+    keep = ~full_name.duplicated(keep='first')
+    fighters_prepared = fighters_df.take(keep.to_numpy().nonzero()[0])
+    fighters_prepared.index = full_name[keep]
 
     for col in ['height_cm', 'reach_in', 'elo']:
         if col in fighters_prepared.columns:
             fighters_prepared[col] = clean_numeric_column(fighters_prepared[col])
     
-    return fighters_prepared
\ No newline at end of file
+    return fighters_prepared
+
+@memory.cache
+def _read_prepared_fighters(fighters_csv_path: str, mtime: float, code_version: float) -> pd.DataFrame:
+    """
+    Reads and prepares the fighters CSV, cached on disk with its dtypes so a fresh
+    process skips both the CSV parsing and the numeric clean-up.
+    """
+    return prepare_fighters_data(load_fighters(fighters_csv_path))
+
+@lru_cache(maxsize=4)
+def _load_prepared_fighters(fighters_csv_path: str, mtime: float) -> pd.DataFrame:
+    """Prepared fighters table, kept in memory. The mtime argument invalidates the cache when the file changes."""
+    # Editing the preparation code here must invalidate the disk cache as well
+    return _read_prepared_fighters(fighters_csv_path, mtime, os.path.getmtime(__file__))
+
+def load_prepared_fighters(fighters_csv_path: str) -> pd.DataFrame:
+    """
+    Returns the prepared fighters DataFrame, parsed only once per version of the file.
+    The same object is shared by every caller, so it must not be modified in place.
+    """
+    return _load_prepared_fighters(fighters_csv_path, os.path.getmtime(fighters_csv_path))
+
+def fights_fingerprint(fights: list[dict[str, Any]], fighters_csv_path: str = FIGHTERS_CSV_PATH) -> str:
+    """
+    Returns a hash identifying a list of fights together with the version of the
+    fighters CSV they are combined with, so anything built from them can be reused.
+    The 'date_obj' key added during training is ignored.
+    """
+    digest = hashlib.sha1()
+    if os.path.exists(fighters_csv_path):
+        digest.update(repr(os.path.getmtime(fighters_csv_path)).encode())
+    for fight in fights:
+        digest.update(repr([(k, v) for k, v in fight.items() if k != 'date_obj']).encode())
+    return digest.hexdigest()
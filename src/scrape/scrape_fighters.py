@@ -1,6 +1,8 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import json
+import orjson
 import time
 import string
 import concurrent.futures
@@ -14,16 +16,30 @@ MAX_WORKERS = 10
 # The delay in seconds between each request to a fighter's detail page.
 # This is a politeness measure to avoid overwhelming the server.
 REQUEST_DELAY = 0.1
+# The timeout in seconds for each HTTP request.
+REQUEST_TIMEOUT = 10
 # --- End Configuration ---
 
+# A single session keeps connections to ufcstats.com alive across requests.
+# The pool is sized to the number of threads that can request at once.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'ufc-scraper/1.0'})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 BASE_URL = "http://ufcstats.com/statistics/fighters?page=all"
 
 def get_soup(url):
     """Fetches and parses a URL into a BeautifulSoup object."""
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        return BeautifulSoup(response.content, 'lxml')
     except requests.exceptions.RequestException as e:
         print(f"Error fetching {url}: {e}")
         return None
@@ -129,8 +145,8 @@ def scrape_all_fighters(json_path):
 
             if (i + 1) > 0 and (i + 1) % 50 == 0:
                 fighters_with_details.sort(key=lambda x: (x['last_name'], x['first_name']))
-                with open(json_path, 'w') as f:
-                    json.dump(fighters_with_details, f, indent=4)
+                with open(json_path, 'wb') as f:
+                    f.write(orjson.dumps(fighters_with_details, option=orjson.OPT_INDENT_2))
                 
     fighters_with_details.sort(key=lambda x: (x['last_name'], x['first_name']))
     return fighters_with_details 
\ No newline at end of file
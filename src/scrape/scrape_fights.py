@@ -1,8 +1,13 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import json
+import lxml.html
+import orjson
 import time
 import concurrent.futures
+import threading
+import os
 from ..config import EVENTS_JSON_PATH
 
 # --- Configuration ---
@@ -12,25 +17,73 @@ MAX_WORKERS = 10
 # The delay in seconds between each request to a fight's detail page.
 # This is a politeness measure to avoid overwhelming the server.
 REQUEST_DELAY = 0.1
+# The number of events scraped concurrently. Each event also uses up to
+# MAX_WORKERS threads for its fights, so keep this small.
+EVENT_WORKERS = 4
+# The maximum number of requests in flight at once across all events and fights.
+# The thread pools above can hold more threads than this; the extra ones wait.
+MAX_CONCURRENT_REQUESTS = 16
+# The timeout in seconds for each HTTP request.
+REQUEST_TIMEOUT = 10
 # --- End Configuration ---
 
+# A single session keeps connections to ufcstats.com alive across requests.
+# The pool is sized to the number of requests that can be in flight at once.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'ufc-scraper/1.0'})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 BASE_URL = "http://ufcstats.com/statistics/events/completed?page=all"
 
-def get_soup(url):
-    response = requests.get(url)
+# Shared by every thread, so the concurrent events together stay within the limit
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+def _fetch(url):
+    """Fetches a URL once a request slot is free and returns the response body."""
+    with _REQUEST_SLOTS:
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()  # Raise an exception for bad status codes
-    return BeautifulSoup(response.text, 'html.parser')
+    return response.content
+
+def get_soup(url):
+    return BeautifulSoup(_fetch(url), 'lxml')
+
+def get_tree(url):
+    """Fetches a URL and parses it into an lxml element tree."""
+    return lxml.html.fromstring(_fetch(url))
+
+def _class_xpath(tag, class_name):
+    """Builds an XPath matching `tag` elements whose class list contains `class_name`."""
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+def _first_row_cells(table):
+    """Returns the <td> cells of the first body row of a table, or an empty list."""
+    tbody = table.find('.//tbody')
+    if tbody is None:
+        return []
+    row = tbody.find('.//tr')
+    if row is None:
+        return []
+    return row.findall('.//td')
 
 def scrape_fight_details(fight_url):
     print(f"  Scraping fight: {fight_url}")
-    soup = get_soup(fight_url)
+    # Fight pages are the bulk of the scraping, so they are walked with lxml
+    # directly instead of through BeautifulSoup.
+    tree = get_tree(fight_url)
     
     # On upcoming fight pages, there's a specific div. If it exists, skip.
-    if soup.find('div', class_='b-fight-details__content-abbreviated'):
+    if tree.xpath(_class_xpath('div', 'b-fight-details__content-abbreviated')):
         print(f"    Upcoming fight, no details available: {fight_url}")
         return None
 
-    tables = soup.find_all('table', class_='b-fight-details__table')
+    tables = tree.xpath(_class_xpath('table', 'b-fight-details__table'))
 
     if not tables:
         print(f"    No stats tables found on {fight_url}")
@@ -40,43 +93,33 @@ def scrape_fight_details(fight_url):
 
     # Helper to extract stats. The stats for both fighters are in <p> tags within a single <td>
     def extract_stats_from_cell(cell, col_name):
-        ps = cell.find_all('p')
+        ps = cell.findall('.//p')
         if len(ps) == 2:
-            fight_details["fighter_1_stats"][col_name] = ps[0].text.strip()
-            fight_details["fighter_2_stats"][col_name] = ps[1].text.strip()
+            fight_details["fighter_1_stats"][col_name] = ps[0].text_content().strip()
+            fight_details["fighter_2_stats"][col_name] = ps[1].text_content().strip()
 
     # --- Totals Table ---
     # The first table contains overall stats
-    totals_table = tables[0]
-    totals_tbody = totals_table.find('tbody')
-    if totals_tbody:
-        totals_row = totals_tbody.find('tr')
-        if totals_row:
-            totals_cols = totals_row.find_all('td')
-            stat_cols = {
-                1: 'kd', 2: 'sig_str', 3: 'sig_str_percent', 4: 'total_str',
-                5: 'td', 6: 'td_percent', 7: 'sub_att', 8: 'rev', 9: 'ctrl'
-            }
-            for index, name in stat_cols.items():
-                if index < len(totals_cols):
-                    extract_stats_from_cell(totals_cols[index], name)
+    totals_cols = _first_row_cells(tables[0])
+    stat_cols = {
+        1: 'kd', 2: 'sig_str', 3: 'sig_str_percent', 4: 'total_str',
+        5: 'td', 6: 'td_percent', 7: 'sub_att', 8: 'rev', 9: 'ctrl'
+    }
+    for index, name in stat_cols.items():
+        if index < len(totals_cols):
+            extract_stats_from_cell(totals_cols[index], name)
 
     # --- Significant Strikes Table ---
     # The second table contains significant strike details
     if len(tables) > 1:
-        sig_strikes_table = tables[1]
-        sig_strikes_tbody = sig_strikes_table.find('tbody')
-        if sig_strikes_tbody:
-            sig_strikes_row = sig_strikes_tbody.find('tr')
-            if sig_strikes_row:
-                sig_strikes_cols = sig_strikes_row.find_all('td')
-                stat_cols = {
-                    2: 'sig_str_head', 3: 'sig_str_body', 4: 'sig_str_leg',
-                    5: 'sig_str_distance', 6: 'sig_str_clinch', 7: 'sig_str_ground'
-                }
-                for index, name in stat_cols.items():
-                     if index < len(sig_strikes_cols):
-                        extract_stats_from_cell(sig_strikes_cols[index], name)
+        sig_strikes_cols = _first_row_cells(tables[1])
+        stat_cols = {
+            2: 'sig_str_head', 3: 'sig_str_body', 4: 'sig_str_leg',
+            5: 'sig_str_distance', 6: 'sig_str_clinch', 7: 'sig_str_ground'
+        }
+        for index, name in stat_cols.items():
+            if index < len(sig_strikes_cols):
+                extract_stats_from_cell(sig_strikes_cols[index], name)
 
     return fight_details
 
@@ -94,6 +137,27 @@ def fetch_fight_details_worker(fight_url):
         time.sleep(REQUEST_DELAY) # Also sleep on failure to be safe
         return None
 
+def fetch_event_details_worker(event_url):
+    """
+    Worker function for the event thread pool. Scrapes a single event and
+    returns None if it could not be processed.
+    """
+    try:
+        return scrape_event_details(event_url)
+    except Exception as e:
+        print(f"Could not process event {event_url}. Error: {e}")
+        return None
+
+def get_event_urls(event_rows):
+    """Extracts the event detail URLs from the rows of the events table."""
+    event_urls = []
+    for row in event_rows:
+        event_link_tag = row.find('a', class_='b-link b-link_style_black')
+        if not event_link_tag or not event_link_tag.has_attr('href'):
+            continue
+        event_urls.append(event_link_tag['href'])
+    return event_urls
+
 def scrape_event_details(event_url):
     print(f"Scraping event: {event_url}")
     soup = get_soup(event_url)
@@ -175,9 +239,24 @@ def scrape_event_details(event_url):
     event_details['fights'] = completed_fights
     return event_details
 
+def _load_checkpoint(checkpoint_path):
+    """Reads the events saved by an interrupted scrape, keyed by event URL."""
+    scraped = {}
+    if not os.path.exists(checkpoint_path):
+        return scraped
+    with open(checkpoint_path, 'rb') as f:
+        for line in f:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # The last line may be cut short if the scrape was killed mid-write.
+                continue
+            if isinstance(entry, dict) and 'url' in entry and 'event' in entry:
+                scraped[entry['url']] = entry['event']
+    return scraped
+
 def scrape_all_events(json_path):
     soup = get_soup(BASE_URL)
-    events = []
 
     table = soup.find('table', class_='b-statistics__table-events')
     if not table:
@@ -185,29 +264,43 @@ def scrape_all_events(json_path):
         return []
 
     event_rows = [row for row in table.find_all('tr', class_='b-statistics__table-row') if row.find('td')]
-    total_events = len(event_rows)
-    print(f"Found {total_events} events to scrape.")
-
-    for i, row in enumerate(event_rows):
-        event_link_tag = row.find('a', class_='b-link b-link_style_black')
-        if not event_link_tag or not event_link_tag.has_attr('href'):
-            continue
-        
-        event_url = event_link_tag['href']
-        
-        try:
-            event_data = scrape_event_details(event_url)
+    event_urls = get_event_urls(event_rows)
+    total_events = len(event_urls)
+    print(f"Found {total_events} events to scrape (using up to {EVENT_WORKERS} concurrent events).")
+
+    # Progress is checkpointed by appending one event per line (NDJSON), so each
+    # checkpoint costs the size of one event instead of re-dumping the whole list.
+    # Each line records the event URL so an interrupted scrape can resume from it.
+    checkpoint_path = os.path.splitext(json_path)[0] + '.jsonl'
+    scraped = _load_checkpoint(checkpoint_path)
+    pending_urls = [url for url in event_urls if url not in scraped]
+    if scraped:
+        print(f"Resuming from {checkpoint_path}: {total_events - len(pending_urls)} events already scraped.")
+
+    # Events are scraped concurrently; map() still yields them in table order.
+    with open(checkpoint_path, 'ab', buffering=1 << 20) as checkpoint, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=EVENT_WORKERS) as executor:
+        done = total_events - len(pending_urls)
+        for i, (event_url, event_data) in enumerate(
+                zip(pending_urls, executor.map(fetch_event_details_worker, pending_urls)), start=done):
             if event_data:
-                events.append(event_data)
-            
+                scraped[event_url] = event_data
+                checkpoint.write(orjson.dumps({'url': event_url, 'event': event_data}) + b'\n')
+
             print(f"Progress: {i+1}/{total_events} events scraped.")
 
             if (i + 1) % 10 == 0:
-                print(f"--- Saving progress: {i + 1} of {total_events} events saved. ---")
-                with open(json_path, 'w') as f:
-                    json.dump(events, f, indent=4)
-        except Exception as e:
-            print(f"Could not process event {event_url}. Error: {e}")
+                checkpoint.flush()
+                print(f"--- Saving progress: {i + 1} of {total_events} events saved to {checkpoint_path}. ---")
+
+    events = [scraped[url] for url in event_urls if url in scraped]
+
+    # Write the complete events list once, then drop the checkpoint file.
+    # The file is only an intermediate for json_to_csv, so it is written compactly.
+    with open(json_path, 'wb') as f:
+        f.write(orjson.dumps(events))
+    os.remove(checkpoint_path)
+    print(f"Saved {len(events)} events to {json_path}")
 
     return events
 
@@ -235,23 +328,15 @@ def scrape_latest_events(json_path, num_events=5):
     
     # Limit to the latest N events (events are ordered chronologically with most recent first)
     latest_event_rows = event_rows[:num_events]
-    total_events = len(latest_event_rows)
+    event_urls = get_event_urls(latest_event_rows)
+    total_events = len(event_urls)
     print(f"Found {len(event_rows)} total events. Scraping latest {total_events} events.")
 
-    for i, row in enumerate(latest_event_rows):
-        event_link_tag = row.find('a', class_='b-link b-link_style_black')
-        if not event_link_tag or not event_link_tag.has_attr('href'):
-            continue
-        
-        event_url = event_link_tag['href']
-        
-        try:
-            event_data = scrape_event_details(event_url)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=EVENT_WORKERS) as executor:
+        for i, event_data in enumerate(executor.map(fetch_event_details_worker, event_urls)):
             if event_data:
                 events.append(event_data)
-            
+
             print(f"Progress: {i+1}/{total_events} latest events scraped.")
-        except Exception as e:
-            print(f"Could not process event {event_url}. Error: {e}")
 
     return events
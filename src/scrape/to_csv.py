@@ -1,15 +1,15 @@
-import json
+import orjson
 import csv
 from ..config import EVENTS_JSON_PATH, FIGHTS_CSV_PATH, FIGHTERS_JSON_PATH
 
 def json_to_csv(json_file_path, csv_file_path):
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as json_file:
-            data = json.load(json_file)
+        with open(json_file_path, 'rb') as json_file:
+            data = orjson.loads(json_file.read())
     except FileNotFoundError:
         print(f"Error: The file {json_file_path} was not found.")
         return
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Error: Could not decode JSON from {json_file_path}.")
         return
 
@@ -91,12 +91,12 @@ def fighters_json_to_csv(json_file_path, csv_file_path):
     It cleans the data by removing unwanted characters and standardizing formats.
     """
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as json_file:
-            data = json.load(json_file)
+        with open(json_file_path, 'rb') as json_file:
+            data = orjson.loads(json_file.read())
     except FileNotFoundError:
         print(f"Error: The file {json_file_path} was not found.")
         return
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Error: Could not decode JSON from {json_file_path}.")
         return
 